@@ -1,40 +1,56 @@
 # app.py — Streamlit UI wrapped in render(), safe for any launch method
 
 from __future__ import annotations
+import hashlib
 import json
 import os
 import sys
 import importlib.util
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Any
 import streamlit as st
 
+try:
+    # optional: parses UTF-8 bytes directly in C, 2-5x faster than stdlib
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_loads(raw: bytes):
+        return json.loads(raw.decode("utf-8"))
+
 
 
 # -------------------- helpers --------------------
 
-def validate_required(vals, sc, i18n_dict):
+def validate_required(vals, compiled_sections, limit=50):
+    # the UI only shows a short list, so stop collecting after `limit`
     errors = []
-    for section in sc.get("sections", []):
-        for fld in section.get("fields", []):
-            if not fld.get("required"):
+    append = errors.append
+    get = vals.get
+    for _title, fields in compiled_sections:
+        for k, label, ftype, _placeholder, required in fields:
+            if not required:
                 continue
-            k = f'{section["key"]}_{fld["key"]}'
-            label = i18n_dict.get(fld.get("label_i18n", fld.get("key", "")), fld.get("key", ""))
-            if fld.get("type") == "checkbox":
-                if not bool(vals.get(k, False)):
-                    errors.append(label)
+            if ftype == "checkbox":
+                if not get(k, False):
+                    append(label)
             else:
-                if not (str(vals.get(k, "") or "").strip()):
-                    errors.append(label)
+                if not (str(get(k, "") or "").strip()):
+                    append(label)
+            if len(errors) >= limit:
+                return errors
     return errors
 
-def v(sec, key, vals):
-    return (vals.get(f"{sec}_{key}", "") or "").strip()
+@st.cache_data(show_spinner=False)
+def _json_cached(path: str, mtime_ns: int) -> dict:
+    # الـ mtime ضمن مفتاح الكاش حتى تُقرأ التعديلات على الملف تلقائيًا
+    return _json_loads(Path(path).read_bytes())
 
 def _json_read(path):
     try:
-        return json.loads(Path(path).read_text(encoding="utf-8"))
+        return _json_cached(str(path), Path(path).stat().st_mtime_ns)
     except FileNotFoundError:
         return {}
 
@@ -47,7 +63,65 @@ def _warn(msg: str) -> None:
 def _safe_is_bytes(obj: Any) -> bool:
     return isinstance(obj, (bytes, bytearray, memoryview))
 
+# Small LRU of finished PDFs so re-clicking "create" with unchanged input
+# returns instantly instead of re-running the ReportLab build.
+_PDF_CACHE: OrderedDict = OrderedDict()
+_PDF_CACHE_MAX = 8
+
+def _pdf_cache_key(form_key, form_data, pdf_options, pdf_i18n, make_interactive, print_flat):
+    h = hashlib.blake2b(digest_size=16)
+    for k in sorted(form_data):
+        val = form_data[k]
+        kb = k.encode("utf-8")
+        vb = val if isinstance(val, (bytes, bytearray)) else str(val).encode("utf-8")
+        # length-prefix each piece so adjacent items can't alias (a value
+        # ending in the next key's text must not hash the same)
+        h.update(len(kb).to_bytes(4, "big"))
+        h.update(kb)
+        h.update(len(vb).to_bytes(4, "big"))
+        h.update(vb)
+    h.update(repr(sorted(pdf_options.items())).encode("utf-8"))
+    # pdf_i18n falls back to the UI language when i18n.de.json is missing,
+    # so the resolved labels must be part of the key across language switches
+    h.update(repr(sorted(pdf_i18n.items())).encode("utf-8"))
+    return (form_key, make_interactive, print_flat, h.digest())
+
 # ---------- Interactive routing helper ----------
+
+@lru_cache(maxsize=1)
+def _interactive_registry() -> dict:
+    """سجل {form_key: دالة البناء التفاعلية} يُبنى مرة واحدة عند أول استخدام.
+
+    يمسح forms/*/interactive_builder.py مرة واحدة فيصبح التوجيه لاحقًا
+    مجرد بحث في dict بلا stat أو تحميل ملفات لكل إرسال.
+    """
+    registry: dict = {}
+    for ib_path in sorted(Path("forms").glob("*/interactive_builder.py")):
+        form_key = ib_path.parent.name
+        try:
+            fn = _load_interactive_builder(form_key, ib_path.stat().st_mtime_ns)
+        except Exception:
+            fn = None
+        if fn is not None:
+            registry[form_key] = fn
+    return registry
+
+
+@lru_cache(maxsize=32)
+def _load_interactive_builder(form_key: str, mtime_ns: int):
+    """تحميل forms/<key>/interactive_builder.py مرة واحدة لكل (مفتاح، mtime).
+
+    الـ mtime ضمن مفتاح الكاش حتى يُعاد التحميل تلقائيًا عند تعديل الملف.
+    """
+    ib_path = Path(f"forms/{form_key}/interactive_builder.py")
+    spec = importlib.util.spec_from_file_location(f"{form_key}_interactive_builder", ib_path)
+    if not (spec and spec.loader):
+        return None
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)  # type: ignore
+    return getattr(mod, f"build_pdf_interactive_{form_key}", None)
+
+
 def build_interactive_pdf_for_form(current, schema, i18n_pdf, pdf_options, form_data, *, flatten=False) -> Optional[bytes]:
     """
     الأولوية:
@@ -57,26 +131,14 @@ def build_interactive_pdf_for_form(current, schema, i18n_pdf, pdf_options, form_
     """
     form_key = current.key
 
-    # 1) Per-form interactive builder
-    ib_path = Path(f"forms/{form_key}/interactive_builder.py")
-    if ib_path.exists():
+    # 1) Per-form interactive builder (registry lookup, no per-call file probing)
+    fn = _interactive_registry().get(form_key)
+    if fn is not None:
         try:
-            importlib.invalidate_caches()
-            spec = importlib.util.spec_from_file_location(f"{form_key}_interactive_builder", ib_path)
-            if spec and spec.loader:
-                mod = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(mod)  # type: ignore
-                func_name = f"build_pdf_interactive_{form_key}"
-                if hasattr(mod, func_name):
-                    fn = getattr(mod, func_name)
-                    res = fn(data=form_data, i18n=i18n_pdf, pdf_options=pdf_options, flatten=flatten)
-                    if _safe_is_bytes(res):
-                        return bytes(res)
-                    _warn(f"الدالة {func_name} لم تُرجِع bytes، سأنتقل للخيار التالي.")
-                else:
-                    _warn(f"الملف موجود لكن الدالة {func_name} غير معرّفة، سأنتقل للخيار التالي.")
-            else:
-                _warn("تعذّر تحميل interactive_builder (spec/loader مفقود)، سأنتقل للخيار التالي.")
+            res = fn(data=form_data, i18n=i18n_pdf, pdf_options=pdf_options, flatten=flatten)
+            if _safe_is_bytes(res):
+                return bytes(res)
+            _warn(f"الدالة build_pdf_interactive_{form_key} لم تُرجِع bytes، سأنتقل للخيار التالي.")
         except Exception as e:
             _warn(f"خطأ أثناء تنفيذ interactive_builder: {e} — الانتقال للخيار التالي.")
 
@@ -104,9 +166,15 @@ def build_interactive_pdf_for_form(current, schema, i18n_pdf, pdf_options, form_
 
 # -------------------- UI wrapped here --------------------
 
-def render():
-    
+@st.cache_resource(show_spinner=False)
+def _discover_forms_cached(lang: str):
+    # اكتشاف النماذج مرة واحدة لكل لغة بدل إعادة المسح عند كل rerun
     from modules.form_loader import discover_forms
+    return discover_forms(preferred_lang=lang)
+
+
+def render():
+
     from modules.signature import (
         draw_signature_ui,
         get_signature_bytes,
@@ -118,7 +186,7 @@ def render():
     lang_ui = st.sidebar.selectbox("Language / اللغة", ["de", "ar", "en"], index=0)
 
     # Discover forms with preferred UI language
-    forms = discover_forms(preferred_lang=lang_ui)
+    forms = _discover_forms_cached(lang_ui)
     if not forms:
         st.error("No forms found. Please add folders under ./forms/<form_key>/")
         st.stop()
@@ -131,11 +199,12 @@ def render():
     # UI i18n = user's chosen language
     ui_i18n = current.i18n
 
-    # PDF i18n = ALWAYS German (fallback to UI if missing)
-    try:
-        pdf_i18n = json.loads(Path(f"forms/{current.key}/i18n.de.json").read_text(encoding="utf-8"))
-    except FileNotFoundError:
+    # PDF i18n = ALWAYS German (fallback to UI if missing);
+    # with German UI both come from the same file, so reuse it directly
+    if lang_ui == "de":
         pdf_i18n = ui_i18n
+    else:
+        pdf_i18n = _json_read(f"forms/{current.key}/i18n.de.json") or ui_i18n
 
     schema = current.schema
     i18n = ui_i18n
@@ -145,20 +214,16 @@ def render():
     with st.form("dynamic_form"):
         values: dict[str, object] = {}
 
-        for section in schema.get("sections", []):
-            st.subheader(i18n.get(section.get("title_i18n", section.get("key", "")), section.get("key", "")))
-            for fld in section.get("fields", []):
-                label = i18n.get(fld.get("label_i18n", fld.get("key", "")), fld.get("key", ""))
-                placeholder = fld.get("placeholder", "")
-                key = f'{section["key"]}_{fld["key"]}'
-                ftype = fld.get("type", "text")
-
-                if ftype == "textarea":
-                    values[key] = st.text_area(label, placeholder=placeholder, key=key)
-                elif ftype == "checkbox":
-                    values[key] = st.checkbox(label, value=False, key=key)
+        for sec_title, widgets in current.render_plan:
+            st.subheader(sec_title)
+            for widget_name, payload in widgets:
+                if widget_name == "row":
+                    cols = st.columns(len(payload))
+                    for col, (wname, kwargs) in zip(cols, payload):
+                        with col:
+                            values[kwargs["key"]] = getattr(st, wname)(**kwargs)
                 else:
-                    values[key] = st.text_input(label, placeholder=placeholder, key=key)
+                    values[payload["key"]] = getattr(st, widget_name)(**payload)
 
         cols = st.columns(2)
         with cols[0]:
@@ -222,30 +287,24 @@ def render():
 
     # Generate PDF
     if submitted:
-        errs = validate_required(values, schema, i18n)
+        errs = validate_required(values, current.compiled_sections)
         if errs:
             st.error(i18n.get("validation.required", "Bitte Pflichtfelder ausfüllen.") + "\n- " + "\n- ".join(errs))
         else:
-            form_data = {
-                **{k: (values.get(k, "") if isinstance(values.get(k), bool) else (str(values.get(k, "") or "").strip()))
-                for k in values.keys()},
-                "stadt": (stadt or "").strip(),
-                "datum": (datum or "").strip(),
-            }
-
-            # convenience mapped fields
-            form_data.update({
-                "vg_name": v("vg", "name", values),
-                "vg_vorname": v("vg", "vorname", values),
-                "vg_geb": v("vg", "geb", values),
-                "vg_addr": v("vg", "addr", values),
-                "b_name": v("b", "name", values),
-                "b_vorname": v("b", "vorname", values),
-                "b_geb": v("b", "geb", values),
-                "b_addr": v("b", "addr", values),
-                "person_name": v("person", "name", values),
-                "person_email": v("person", "email", values),
-            })
+            # intern the keys: they repeat on every submit/session, so dict
+            # probes become pointer compares and the strings are shared
+            form_data = {}
+            for k, val in values.items():
+                form_data[sys.intern(k)] = val if isinstance(val, bool) else (str(val or "").strip())
+            form_data["stadt"] = (stadt or "").strip()
+            form_data["datum"] = (datum or "").strip()
+
+            # convenience mapped fields — values are already stripped above,
+            # only make sure the keys exist for builders of other forms
+            for mk in ("vg_name", "vg_vorname", "vg_geb", "vg_addr",
+                       "b_name", "b_vorname", "b_geb", "b_addr",
+                       "person_name", "person_email"):
+                form_data.setdefault(mk, "")
 
             if signature_data:
                 form_data["signature_bytes"] = signature_data
@@ -253,29 +312,38 @@ def render():
             base_opts = _json_read("setup-config.json").get("pdf_options", {})
             pdf_options = {**base_opts, **sig_opts}
 
-            if make_interactive or print_flat:
-                pdf_bytes = build_interactive_pdf_for_form(
-                    current=current,
-                    schema=schema,
-                    i18n_pdf=pdf_i18n,
-                    pdf_options=pdf_options,
-                    form_data=form_data,
-                    flatten=print_flat,
-                )
-                if pdf_bytes is None:
+            cache_key = _pdf_cache_key(current.key, form_data, pdf_options,
+                                       pdf_i18n, make_interactive, print_flat)
+            pdf_bytes = _PDF_CACHE.get(cache_key)
+            if pdf_bytes is not None:
+                _PDF_CACHE.move_to_end(cache_key)
+            else:
+                if make_interactive or print_flat:
+                    pdf_bytes = build_interactive_pdf_for_form(
+                        current=current,
+                        schema=schema,
+                        i18n_pdf=pdf_i18n,
+                        pdf_options=pdf_options,
+                        form_data=form_data,
+                        flatten=print_flat,
+                    )
+                    if pdf_bytes is None:
+                        pdf_bytes = current.builder.build_pdf(
+                            form_data,
+                            i18n=pdf_i18n,
+                            pdf_options=pdf_options,
+                            signature_bytes=signature_data
+                        )
+                else:
                     pdf_bytes = current.builder.build_pdf(
                         form_data,
                         i18n=pdf_i18n,
                         pdf_options=pdf_options,
                         signature_bytes=signature_data
                     )
-            else:
-                pdf_bytes = current.builder.build_pdf(
-                    form_data,
-                    i18n=pdf_i18n,
-                    pdf_options=pdf_options,
-                    signature_bytes=signature_data
-                )
+                _PDF_CACHE[cache_key] = pdf_bytes
+                if len(_PDF_CACHE) > _PDF_CACHE_MAX:
+                    _PDF_CACHE.popitem(last=False)
 
             st.success(i18n.get("msg.created", "PDF created."))
             dl_suffix = ""
@@ -294,6 +362,12 @@ def render():
 # -------------------- run guards --------------------
 
 def _in_streamlit_runner() -> bool:
+    # كاشف Streamlit المدمج — أرخص من استيراد scriptrunner في كل فحص
+    try:
+        if st.runtime.exists():
+            return True
+    except Exception:
+        pass
     try:
         # موجودة فقط داخل بيئة streamlit runner
         from streamlit.runtime.scriptrunner import get_script_run_ctx  # type: ignore
@@ -0,0 +1,42 @@
+# forms/obdachlosigkeit/__init__.py
+"""Dual-export helpers: build the static and interactive PDFs in parallel.
+
+ReportLab work is CPU-bound pure Python, so producing both variants for
+the same data (or many PDFs in a batch) parallelizes across cores with a
+process pool. The job functions are module-level so they pickle by name;
+workers import the builder modules once and reuse them across tasks.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _static_job(args):
+    from forms.obdachlosigkeit import builder
+    data, i18n, pdf_options, signature_bytes = args
+    return builder.build_pdf(data, i18n, pdf_options, signature_bytes)
+
+
+def _interactive_job(args):
+    from forms.obdachlosigkeit import interactive_builder
+    data, i18n, pdf_options = args
+    return interactive_builder.build_pdf_interactive_obdachlosigkeit(
+        data, i18n=i18n, pdf_options=pdf_options
+    )
+
+
+def build_both(data: dict, i18n: dict, pdf_options: dict | None = None,
+               signature_bytes: bytes | None = None) -> tuple[bytes, bytes]:
+    """Return (static_pdf, interactive_pdf) for the same form data,
+    generated on two worker processes."""
+    pdf_options = pdf_options or {}
+    with ProcessPoolExecutor(max_workers=2) as ex:
+        static = ex.submit(_static_job, (data, i18n, pdf_options, signature_bytes))
+        interactive = ex.submit(_interactive_job, (data, i18n, pdf_options))
+        return static.result(), interactive.result()
+
+
+def build_many(jobs: list, max_workers: int | None = None,
+               chunksize: int = 8) -> list[bytes]:
+    """Batch-generate static PDFs; each job is a
+    (data, i18n, pdf_options, signature_bytes) tuple."""
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(_static_job, jobs, chunksize=chunksize))
@@ -1,5 +1,10 @@
+import copy
+import importlib.util
+from functools import lru_cache
+from collections import namedtuple
 from io import BytesIO
-from PIL import Image as PILImage, ImageChops
+from pathlib import Path
+from PIL import Image as PILImage
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.platypus import (
@@ -8,8 +13,85 @@ from reportlab.platypus import (
 )
 from reportlab.lib.styles import getSampleStyleSheet
 
-from modules.pdf_utils import base_table_style, checkbox_box, checkbox_row
+from modules.pdf_utils import base_table_style, checkbox_box, checkbox_row, _truthy
 from modules.signature_utils import build_signature_block
+from modules.image_utils import trim_whitespace
+
+# built once per process; style objects are read-only during builds
+_STYLES = getSampleStyleSheet()
+_TABLE_STYLE = base_table_style()
+_HEADER_STYLE = TableStyle([
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("TEXTCOLOR", (1, 0), (1, 0), colors.black),
+])
+_HEADER_COLW = (12, 508)
+_BOX_COLW = (520,)
+
+_Labels = namedtuple("_Labels", [
+    "person_name", "person_geb", "section_erst", "erst_gruende",
+    "section_unterb", "unterb_gruende", "section_verl",
+    "section_wechsel", "wechsel_gruende", "ort", "datum",
+])
+
+_LABELS_CACHE: dict = {}
+
+# literally constant flowables — Paragraph re-parses its markup on every
+# construction, so build these once per process. doc.build mutates
+# flowables during wrap/draw (blPara, width, canv), so builds get clones
+# of these prototypes rather than the shared objects themselves
+_P_ERST_INTRO = Paragraph(
+    "Ich/ Meine Familie benötigt einen Platz im Wohnheim, um nicht auf der Straße schlafen zu müssen.",
+    _STYLES["Normal"]
+)
+_P_VERL_HINT = Paragraph(
+    "Es ist mir nicht gelungen, eine Wohnung anzumieten oder woanders unterzukommen.",
+    _STYLES["Normal"]
+)
+_SP4 = Spacer(1, 4)
+_SP8 = Spacer(1, 8)
+_SP10 = Spacer(1, 10)
+_SP12 = Spacer(1, 12)
+_SP14 = Spacer(1, 14)
+
+
+def _resolve_labels(i18n: dict) -> _Labels:
+    """Resolve the fixed label set once per i18n dict instead of per PDF."""
+    cached = _LABELS_CACHE.get(id(i18n))
+    # identity re-check as in modules/pdf_interactive: the entry keeps the
+    # keyed dict alive, and a new dict recycling a freed dict's id() must
+    # not be served the old dict's labels
+    if cached is not None and cached[0] is i18n:
+        return cached[1]
+    labels = _Labels(
+        person_name=i18n.get("person.name", "Name, Vorname"),
+        person_geb=i18n.get("person.geb", "Geburtsdatum"),
+        section_erst=i18n.get("section.erst", "Erstzuweisung"),
+        erst_gruende=i18n.get("erst.gruende", "Gründe …"),
+        section_unterb=i18n.get("section.unterb", "Zuweisung nach Unterbrechung"),
+        unterb_gruende=i18n.get("unterb.gruende", "Gründe …"),
+        section_verl=i18n.get("section.verl", "Verlängerung der Zuweisung"),
+        section_wechsel=i18n.get("section.wechsel", "Wechsel des Wohnheimes"),
+        wechsel_gruende=i18n.get("wechsel.gruende", "Ich/Wir benötige/n aus folgenden Gründen einen neuen Wohnheimplatz"),
+        ort=i18n.get("field.ort", "Ort"),
+        datum=i18n.get("field.datum", "Datum"),
+    )
+    if len(_LABELS_CACHE) > 8:
+        _LABELS_CACHE.clear()
+    _LABELS_CACHE[id(i18n)] = (i18n, labels)
+    return labels
+
+
+@lru_cache(maxsize=8)
+def _label_paragraphs(labels: _Labels) -> tuple:
+    """Pre-parsed Paragraphs for the i18n label strings, one set per
+    distinct label tuple — their markup parse and text measurement are
+    identical across builds."""
+    normal = _STYLES["Normal"]
+    return (
+        Paragraph(labels.erst_gruende, normal),
+        Paragraph(labels.unterb_gruende, normal),
+        Paragraph(labels.wechsel_gruende, normal),
+    )
 
 
 def _bool(value) -> bool:
@@ -21,10 +103,7 @@ def _bool(value) -> bool:
     Returns:
         bool: True if the value represents a truthy indicator, else False.
     """
-    string_value = (str(value or "")).strip().lower()
-    return string_value in {
-        "1", "true", "ja", "yes", "y", "on", "x", "✓", "checked"
-    }
+    return _truthy(value)
 
 
 def _trim(img: PILImage.Image) -> PILImage.Image:
@@ -36,21 +115,47 @@ def _trim(img: PILImage.Image) -> PILImage.Image:
     Returns:
         PILImage.Image: Cropped image without extra borders.
     """
-    if img.mode in ("LA", "RGBA"):
-        bbox = img.split()[-1].getbbox()
-        return img.crop(bbox) if bbox else img
+    # delegate to the shared NumPy bounding-box scan instead of the old
+    # ImageChops.difference pass (full-frame allocation + diff image)
+    return trim_whitespace(img)
+
+
+_INTERACTIVE_MOD = None
 
-    rgb_img = img.convert("RGB")
-    diff = ImageChops.difference(
-        rgb_img, PILImage.new("RGB", rgb_img.size, (255, 255, 255))
+
+def _interactive():
+    """Lazily load the sibling interactive_builder module (same pattern
+    as the loaders in app.py)."""
+    global _INTERACTIVE_MOD
+    if _INTERACTIVE_MOD is None:
+        path = Path(__file__).with_name("interactive_builder.py")
+        spec = importlib.util.spec_from_file_location("obdachlosigkeit_interactive", path)
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)  # type: ignore
+        _INTERACTIVE_MOD = mod
+    return _INTERACTIVE_MOD
+
+
+@lru_cache(maxsize=32)
+def _section_header_proto(title_text: str, checked: bool):
+    """Prototype header Table: only two variants exist per section title,
+    so the Table (and the nested checkbox Table) is built and styled at
+    most twice per title instead of on every PDF."""
+    table = Table(
+        [[checkbox_box(checked, size=12), f"  {title_text}"],],
+        colWidths=_HEADER_COLW
     )
-    bbox = diff.getbbox()
-    return img.crop(bbox) if bbox else img
+    table.setStyle(_HEADER_STYLE)
+    return table
 
 
 def section_header(title_text: str, checked: bool):
     """Create a section header with a checkbox and title text.
 
+    Returns a deep clone of the cached prototype — Table.wrap/draw mutate
+    both the header and its nested checkbox Table, so concurrent builds
+    must not share them.
+
     Args:
         title_text (str): The header text.
         checked (bool): Whether the checkbox is checked.
@@ -58,23 +163,17 @@ def section_header(title_text: str, checked: bool):
     Returns:
         Table: ReportLab Table containing the header.
     """
-    table = Table(
-        [[checkbox_box(checked, size=12), f"  {title_text}"],],
-        colWidths=[12, 508]
-    )
-    table.setStyle(TableStyle([
-        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-        ("TEXTCOLOR", (1, 0), (1, 0), colors.black),
-    ]))
-    return table
+    return copy.deepcopy(_section_header_proto(title_text, checked))
 
 
 def build_pdf(
     data: dict,
     i18n: dict,
     pdf_options: dict,
-    signature_bytes: bytes | None = None
-) -> bytes:
+    signature_bytes: bytes | None = None,
+    *,
+    output=None
+) -> bytes | None:
     """Build a PDF document for reporting involuntary homelessness.
 
     Args:
@@ -82,11 +181,25 @@ def build_pdf(
         i18n (dict): Internationalization dictionary for text.
         pdf_options (dict): Configuration for PDF layout and style.
         signature_bytes (bytes | None): Optional image bytes for signature.
+        output: Seekable binary stream to write the PDF to directly.
 
     Returns:
-        bytes: Generated PDF file content.
+        bytes | None: Generated PDF content, or None when streamed to `output`.
     """
-    buffer = BytesIO()
+    if pdf_options.get("canvas_fast_path"):
+        # bypass Platypus entirely: the interactive builder draws the same
+        # form with hand-positioned canvas coordinates, and flatten=True
+        # yields a plain static PDF without AcroForm fields
+        payload = data
+        if signature_bytes:
+            payload = dict(data)
+            payload["signature_bytes"] = signature_bytes
+        return _interactive().build_pdf_interactive_obdachlosigkeit(
+            payload, i18n=i18n, pdf_options=pdf_options, flatten=True,
+            output=output,
+        )
+
+    buffer = BytesIO() if output is None else output
     doc = SimpleDocTemplate(
         buffer,
         pagesize=A4,
@@ -96,19 +209,31 @@ def build_pdf(
         bottomMargin=pdf_options.get("bottomMargin", 36),
     )
 
-    styles = getSampleStyleSheet()
+    styles = _STYLES
     normal = styles["Normal"]
     title_style = styles["Title"]
 
-    elements = []
-
-    elements.append(Paragraph(
-        f"<b>{i18n.get(pdf_options.get('title_i18n', 'app.title'), 'Anzeige von unfreiwilliger Obdachlosigkeit')}</b>",
-        title_style
-    ))
-    elements.append(Spacer(1, 8))
+    # one clone per shared prototype per build; sequential reuse within a
+    # single build is fine, concurrent builds must not share layout state
+    sp4, sp8, sp10, sp12, sp14 = (
+        copy.copy(_SP4), copy.copy(_SP8), copy.copy(_SP10),
+        copy.copy(_SP12), copy.copy(_SP14),
+    )
+    p_erst_intro = copy.copy(_P_ERST_INTRO)
+    p_verl_hint = copy.copy(_P_VERL_HINT)
+
+    # Title style is already Helvetica-Bold — no need for <b> markup
+    elements = [
+        Paragraph(
+            i18n.get(pdf_options.get('title_i18n', 'app.title'), 'Anzeige von unfreiwilliger Obdachlosigkeit'),
+            title_style
+        ),
+        sp8,
+    ]
 
-    table_style = base_table_style()
+    labels = _resolve_labels(i18n)
+    p_erst, p_unterb, p_wechsel = map(copy.copy, _label_paragraphs(labels))
+    table_style = _TABLE_STYLE
 
     has_relatives = _bool(data.get("person_has_relatives"))
     relatives_line = (data.get("person_relatives_text") or "").strip()
@@ -120,63 +245,64 @@ def build_pdf(
     relatives_table.setStyle(TableStyle([("VALIGN", (0, 0), (-1, -1), "MIDDLE")]))
 
     top_table = Table([
-        [i18n.get("person.name", "Name, Vorname"),
-         i18n.get("person.geb", "Geburtsdatum"),
+        [labels.person_name,
+         labels.person_geb,
          "Angehörige"],
         [data.get("person_name", ""),
          data.get("person_geb", ""),
          relatives_table]
     ], colWidths=[220, 120, 180])
     top_table.setStyle(table_style)
-    elements += [top_table, Spacer(1, 14)]
+    elements += [top_table, sp14]
 
     def box_line(label_text: str, height_pt=None):
-        col_widths = [520]
         if height_pt:
-            table = Table([[label_text]], colWidths=col_widths, rowHeights=[height_pt])
+            table = Table([[label_text]], colWidths=_BOX_COLW, rowHeights=[height_pt])
         else:
-            table = Table([[label_text]], colWidths=col_widths)
+            table = Table([[label_text]], colWidths=_BOX_COLW)
         table.setStyle(table_style)
         return table
 
     elements += [
-        section_header(i18n.get("section.erst", "Erstzuweisung"), _bool(data.get("erst_checked"))),
-        Spacer(1, 4),
-        Paragraph("Ich/ Meine Familie benötigt einen Platz im Wohnheim, um nicht auf der Straße schlafen zu müssen.", normal),
-        Spacer(1, 4),
-        Paragraph(i18n.get("erst.gruende", "Gründe …"), normal),
+        section_header(labels.section_erst, _bool(data.get("erst_checked"))),
+        sp4,
+        p_erst_intro,
+        sp4,
+        p_erst,
         box_line(data.get("erst_gruende", "")),
-        Spacer(1, 10),
+        sp10,
     ]
 
     elements += [
-        section_header(i18n.get("section.unterb", "Zuweisung nach Unterbrechung"), _bool(data.get("unterb_checked"))),
-        Spacer(1, 4),
-        Paragraph(i18n.get("unterb.gruende", "Gründe …"), normal),
+        section_header(labels.section_unterb, _bool(data.get("unterb_checked"))),
+        sp4,
+        p_unterb,
         box_line(data.get("unterb_gruende", "")),
-        Spacer(1, 10),
+        sp10,
     ]
 
     end_date = (data.get("verl_endet_am", "") or "").strip()
     elements += [
-        section_header(i18n.get("section.verl", "Verlängerung der Zuweisung"), _bool(data.get("verl_checked"))),
-        Spacer(1, 4),
+        section_header(labels.section_verl, _bool(data.get("verl_checked"))),
+        sp4,
         Paragraph(f"Die Zuweisung für das Wohnheim endet/e am: {end_date}", normal),
-        Paragraph("Es ist mir nicht gelungen, eine Wohnung anzumieten oder woanders unterzukommen.", normal),
-        Spacer(1, 10),
+        p_verl_hint,
+        sp10,
     ]
 
     elements += [
-        section_header(i18n.get("section.wechsel", "Wechsel des Wohnheimes"), _bool(data.get("wechsel_checked"))),
-        Spacer(1, 4),
-        Paragraph(i18n.get("wechsel.gruende", "Ich/Wir benötige/n aus folgenden Gründen einen neuen Wohnheimplatz"), normal),
+        section_header(labels.section_wechsel, _bool(data.get("wechsel_checked"))),
+        sp4,
+        p_wechsel,
         box_line(data.get("wechsel_gruende", ""), height_pt=170.08),
     ]
 
     city = data.get("stadt", "")
     date_field = data.get("datum", "")
-    elements.append(Paragraph(f"{i18n.get('field.ort', 'Ort')}: {city}    {i18n.get('field.datum', 'Datum')}: {date_field}", normal))
-    elements.append(Spacer(1, 12))
+    elements += [
+        Paragraph(f"{labels.ort}: {city}    {labels.datum}: {date_field}", normal),
+        sp12,
+    ]
 
     signature_block = build_signature_block(
         signature_bytes,
@@ -186,5 +312,4 @@ def build_pdf(
     elements += [Indenter(left=0), KeepTogether(signature_block), Indenter(left=0)]
 
     doc.build(elements)
-    buffer.seek(0)
-    return buffer.read()
+    return None if output is not None else buffer.getvalue()
@@ -1,142 +1,200 @@
 from __future__ import annotations
+import hashlib
+from collections import OrderedDict, namedtuple
 from io import BytesIO
 from typing import Dict, Any
 
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
 from reportlab.lib.utils import ImageReader
 from reportlab.platypus import Paragraph
-from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from PIL import Image as PILImage
 from modules.image_utils import trim_whitespace   # ✅ التعديل الجديد
-
-FF_MULTILINE = 1 << 12  # 4096
-
-
-def _pt(v: float) -> float:
-    return float(v)
-
-
-def _draw_box(c, x, y, w, h, *, fill=None, stroke=1, dash=None):
-    if dash:
-        c.setDash(dash, 0)
-    else:
-        c.setDash()
-    if fill is not None:
-        c.setFillColor(fill)
-        c.rect(x, y, w, h, stroke=stroke, fill=1)
-        c.setFillColor(colors.black)
-    else:
-        c.rect(x, y, w, h, stroke=stroke, fill=0)
-
-
-def _text(c, x, y, txt, size=10, bold=False):
-    c.setFont("Helvetica-Bold" if bold else "Helvetica", size)
-    c.drawString(x, y, txt)
+from modules.pdf_utils import _truthy
+from modules.signature_utils import _fit_box
+from modules.pdf_draw import (
+    FF_MULTILINE, _pt, _draw_box, _draw_frame, _set_font, _text,
+    _checkbox_interactive, _textfield_interactive, _emit_fields, _emit_texts,
+)
+
+# built once per process; read-only after init
+_STYLES = getSampleStyleSheet()
+_PSTYLE = ParagraphStyle(
+    "obdN", parent=_STYLES["Normal"],
+    fontName="Helvetica", fontSize=10, leading=12,
+)
+
+
+_Labels = namedtuple("_Labels", [
+    "title", "person_name", "person_geb", "has_relatives", "relatives_text",
+    "section_erst", "erst_gruende", "section_unterb", "unterb_gruende",
+    "section_verl", "verl_endet_am", "section_wechsel", "wechsel_gruende",
+    "ort", "datum", "signature",
+])
+
+_LABELS_CACHE: Dict[int, tuple] = {}
+
+
+def _resolve_labels(i18n: Dict[str, str]) -> _Labels:
+    """حل كل تسميات الواجهة مرة واحدة لكل قاموس i18n بدل ~16 بحثًا لكل PDF."""
+    cached = _LABELS_CACHE.get(id(i18n))
+    # identity re-check as in modules/pdf_interactive: the entry keeps the
+    # keyed dict alive, and a new dict recycling a freed dict's id() must
+    # not be served the old dict's labels
+    if cached is not None and cached[0] is i18n:
+        return cached[1]
+    labels = _Labels(
+        title=i18n.get("app.title", "Anzeige von unfreiwilliger Obdachlosigkeit"),
+        person_name=i18n.get("person.name", "Name, Vorname"),
+        person_geb=i18n.get("person.geb", "Geburtsdatum"),
+        has_relatives=i18n.get("person.has_relatives", "Angehörige"),
+        relatives_text=i18n.get("person.relatives_text", "Angehörige:"),
+        section_erst=i18n.get("section.erst", "Erstzuweisung"),
+        erst_gruende=i18n.get("erst.gruende", "Gründe …"),
+        section_unterb=i18n.get("section.unterb", "Zuweisung nach Unterbrechung"),
+        unterb_gruende=i18n.get("unterb.gruende", "Gründe …"),
+        section_verl=i18n.get("section.verl", "Verlängerung der Zuweisung"),
+        verl_endet_am=i18n.get("verl.endet_am", "Endet am"),
+        section_wechsel=i18n.get("section.wechsel", "Wechsel des Wohnheimes"),
+        wechsel_gruende=i18n.get("wechsel.gruende", "Ich/Wir benötige/n …"),
+        ort=i18n.get("field.ort", "Ort"),
+        datum=i18n.get("field.datum", "Datum"),
+        signature=i18n.get("signature.title", "Unterschrift"),
+    )
+    if len(_LABELS_CACHE) > 8:
+        _LABELS_CACHE.clear()
+    _LABELS_CACHE[id(i18n)] = (i18n, labels)
+    return labels
 
 
 def _booly(x: Any) -> bool:
-    s = str(x or "").strip().lower()
-    return s in {"1", "true", "y", "yes", "ja", "on", "x", "✓", "checked"}
-
-
-def _checkbox_interactive(c, name, tooltip, x, y, size=12, checked=False):
-    c.acroForm.checkbox(
-        name=name,
-        tooltip=tooltip,
-        x=x,
-        y=y,
-        size=size,
-        borderStyle="solid",
-        borderWidth=0,
-        checked=bool(checked),
-        buttonStyle="check",
-    )
+    return _truthy(x)
 
 
-def _textfield_interactive(c, name, tooltip, x, y, w, h, *, multiline=False, value: str = ""):
-    flags = FF_MULTILINE if multiline else 0
-    c.acroForm.textfield(
-        name=name,
-        tooltip=tooltip,
-        x=x, y=y, width=w, height=h,
-        borderStyle="inset",
-        borderWidth=0,
-        forceBorder=False,
-        fieldFlags=flags,
-        value=value,
-        fillColor=colors.white,        # الخلفية بيضاء
-        textColor=colors.black,
-    )
+# decoded+trimmed signatures keyed by content hash — regenerating the same
+# form re-sends identical bytes, so skip the PNG decode and trim scan.
+# Reusing the ImageReader object also lets ReportLab reuse its raster.
+_SIG_READER_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_SIG_CACHE_MAX = 8
+_SIG_HASH_LIMIT = 2 * 1024 * 1024  # don't hash unreasonably large uploads
 
 
-def _draw_signature_image(c, raw_bytes: bytes, x: float, y: float, w_box: float, h_box: float, *, trim=True, mode="fit"):
-    pil = PILImage.open(BytesIO(raw_bytes)).convert("RGBA")
+def _trimmed_reader(raw_bytes: bytes, trim: bool):
+    key = None
+    if len(raw_bytes) <= _SIG_HASH_LIMIT:
+        key = (hashlib.blake2b(raw_bytes, digest_size=16).digest(), trim)
+        cached = _SIG_READER_CACHE.get(key)
+        if cached is not None:
+            _SIG_READER_CACHE.move_to_end(key)
+            return cached
     if trim:
+        pil = PILImage.open(BytesIO(raw_bytes))
+        if pil.mode != "RGBA":
+            pil = pil.convert("RGBA")
         pil = trim_whitespace(pil)   # ✅ استبدال _trim_pil
-    if mode.lower() == "stretch":
-        dw, dh = w_box, h_box
+        entry = (ImageReader(pil), pil.size)
     else:
-        w_img, h_img = pil.size
-        aspect = h_img / float(w_img or 1)
-        dw = w_box
-        dh = dw * aspect
-        if dh > h_box:
-            dh = h_box
-            dw = dh / (aspect or 1)
-    img = ImageReader(pil)
+        # no trim → hand the compressed bytes straight to ImageReader and
+        # let ReportLab embed them without a decode/RGBA round-trip
+        reader = ImageReader(BytesIO(raw_bytes))
+        entry = (reader, reader.getSize())
+    if key is not None:
+        _SIG_READER_CACHE[key] = entry
+        if len(_SIG_READER_CACHE) > _SIG_CACHE_MAX:
+            _SIG_READER_CACHE.popitem(last=False)
+    return entry
+
+
+def _draw_signature_image(c, raw_bytes: bytes, x: float, y: float, w_box: float, h_box: float, *, trim=True, mode="fit"):
+    img, (w_img, h_img) = _trimmed_reader(bytes(raw_bytes), bool(trim))
+    dw, dh = _fit_box(w_img, h_img, w_box, h_box, mode.lower())
     c.drawImage(img, x, y, width=dw, height=dh, mask="auto")
 
 
+# fixed layout dimensions (points) — everything except the page margins is
+# static, so compute the derived widths once at import instead of per call
+_PAD = 6
+_COL1, _COL2, _COL3 = 220.0, 120.0, 180.0
+_TABLE_W = _COL1 + _COL2 + _COL3
+_HDR_H = 32
+_DATA_H = 84
+_TF_PAD, _TF_H = 6, 16
+
+
 def build_pdf_interactive_obdachlosigkeit(
     data: Dict[str, Any] | None,
     *,
     i18n: Dict[str, str],
     pdf_options: Dict[str, Any] | None = None,
     flatten: bool = False,
-) -> bytes:
-    data = data or {}
+    output=None,
+) -> bytes | None:
     pdf_options = pdf_options or {}
+    if data:
+        def _sval(key):
+            return str(data.get(key, ""))
+
+        def _cval(key):
+            return _booly(data.get(key))
+    else:
+        # blank-template fast path: pre-warming an empty fillable form is
+        # common, so skip the ~20 dict lookups and str coercions outright
+        data = {}
+        def _sval(key):
+            return ""
+
+        def _cval(key):
+            return False
     left = _pt(pdf_options.get("leftMargin", 40))
     top = _pt(pdf_options.get("topMargin", 36))
 
     page_w, page_h = A4
-    buf = BytesIO()
+    buf = BytesIO() if output is None else output
     c = canvas.Canvas(buf, pagesize=A4)
     c.setAuthor("vollmacht_all")
 
-    title_text = i18n.get("app.title", "Anzeige von unfreiwilliger Obdachlosigkeit")
+    labels = _resolve_labels(i18n)
+    title_text = labels.title
     c.setFont("Helvetica-Bold", 16)
     c.drawString(left, page_h - top, title_text)
     y = page_h - top - 18
 
-    c.setFont("Helvetica", 10)
-    styles = getSampleStyleSheet()
-    psty = styles["Normal"]; psty.fontName="Helvetica"; psty.fontSize=10; psty.leading=12
+    _set_font(c, "Helvetica", 10)
+    psty = _PSTYLE
+    text_runs: list = []
 
-    grid = {"pad": 6}
-    col1, col2, col3 = 220.0, 120.0, 180.0
-    table_w = col1 + col2 + col3
+    def T(x, y, txt, size=10, bold=False):
+        text_runs.append(("Helvetica-Bold" if bold else "Helvetica", size, x, y, txt))
+
+    col1, col2, col3 = _COL1, _COL2, _COL3
+    table_w = _TABLE_W
     table_x = left
     table_y = y - 8
 
-    hdr_h = 32
-    c.rect(table_x, table_y - hdr_h, table_w, hdr_h, stroke=1, fill=0)
-    c.line(table_x + col1, table_y, table_x + col1, table_y - hdr_h)
-    c.line(table_x + col1 + col2, table_y, table_x + col1 + col2, table_y - hdr_h)
-
-    _text(c, table_x + grid["pad"], table_y - 12, i18n.get("person.name", "Name, Vorname"))
-    _text(c, table_x + col1 + grid["pad"], table_y - 12, i18n.get("person.geb", "Geburtsdatum"))
-    _text(c, table_x + col1 + col2 + grid["pad"], table_y - 12, "Angehörige")
-
-    data_h = 84
+    hdr_h = _HDR_H
+    data_h = _DATA_H
     row_y = table_y - hdr_h - data_h
-    c.rect(table_x, row_y, table_w, data_h, stroke=1, fill=0)
-    c.line(table_x + col1, table_y - hdr_h, table_x + col1, row_y)
-    c.line(table_x + col1 + col2, table_y - hdr_h, table_x + col1 + col2, row_y)
+    # the whole top-table frame is one stroked path: two boxes plus the
+    # two column separators running through both rows
+    _draw_frame(
+        c,
+        segments=(
+            (table_x + col1, table_y, table_x + col1, row_y),
+            (table_x + col1 + col2, table_y, table_x + col1 + col2, row_y),
+        ),
+        rects=(
+            (table_x, table_y - hdr_h, table_w, hdr_h),
+            (table_x, row_y, table_w, data_h),
+        ),
+    )
+
+    T(table_x + _PAD, table_y - 12, labels.person_name)
+    T(table_x + col1 + _PAD, table_y - 12, labels.person_geb)
+    T(table_x + col1 + col2 + _PAD, table_y - 12, "Angehörige")
 
-    tf_pad, tf_h = 6, 16
+    tf_pad, tf_h = _TF_PAD, _TF_H
+    form_fields: list = []
 
     def TF(name, tooltip, x, y, w, h, *, multiline=False, value=""):
         if flatten:
@@ -145,78 +203,78 @@ def build_pdf_interactive_obdachlosigkeit(
                 para.wrapOn(c, w - 2, h - 2)
                 para.drawOn(c, x + 1, y + 1)
             else:
-                c.setFont("Helvetica", 10)
+                _set_font(c, "Helvetica", 10)
                 c.drawString(x + 1, y + h - 12, value or "")
         else:
-            _textfield_interactive(c, name, tooltip, x, y, w, h, multiline=multiline, value=value)
+            form_fields.append(("tf", name, tooltip, x, y, w, h, multiline, value))
 
     def CB(name, tooltip, x, y, size, checked):
         if flatten:
             c.rect(x, y, size, size, stroke=1, fill=0)
             if checked:
-                c.setFont("Helvetica", 12); c.drawString(x + 2, y + 1, "✓"); c.setFont("Helvetica", 10)
+                _set_font(c, "Helvetica", 12); c.drawString(x + 2, y + 1, "✓"); _set_font(c, "Helvetica", 10)
         else:
-            _checkbox_interactive(c, name, tooltip, x, y, size=size, checked=checked)
+            form_fields.append(("cb", name, tooltip, x, y, size, checked))
 
-    TF("person_name", i18n.get("person.name", "Name, Vorname"),
+    TF("person_name", labels.person_name,
        table_x + tf_pad, row_y + data_h - tf_pad - tf_h, col1 - 2 * tf_pad, tf_h,
-       value=str(data.get("person_name", "")))
+       value=_sval("person_name"))
 
-    TF("person_geb", i18n.get("person.geb", "Geburtsdatum"),
+    TF("person_geb", labels.person_geb,
        table_x + col1 + tf_pad, row_y + data_h - tf_pad - tf_h, col2 - 2 * tf_pad, tf_h,
-       value=str(data.get("person_geb", "")))
+       value=_sval("person_geb"))
 
     rel_x = table_x + col1 + col2 + tf_pad
     rel_y_top = row_y + data_h - tf_pad - tf_h
-    CB("person_no_relatives", "keine Angehörige", rel_x, rel_y_top, 12, checked=not _booly(data.get("person_has_relatives")))
-    _text(c, rel_x + 16, rel_y_top + 2, "keine Angehörige")
+    CB("person_no_relatives", "keine Angehörige", rel_x, rel_y_top, 12, checked=not _cval("person_has_relatives"))
+    T(rel_x + 16, rel_y_top + 2, "keine Angehörige")
 
     rel2_y = rel_y_top - 24
-    CB("person_has_relatives", i18n.get("person.has_relatives", "Angehörige"), rel_x, rel2_y, 12, checked=_booly(data.get("person_has_relatives")))
-    _text(c, rel_x + 16, rel2_y + 2, i18n.get("person.has_relatives", "Angehörige"))
-    TF("person_relatives_text", i18n.get("person.relatives_text", "Angehörige:"),
+    CB("person_has_relatives", labels.has_relatives, rel_x, rel2_y, 12, checked=_cval("person_has_relatives"))
+    T(rel_x + 16, rel2_y + 2, labels.has_relatives)
+    TF("person_relatives_text", labels.relatives_text,
        rel_x, rel2_y - 20, col3 - 2 * tf_pad, tf_h,
-       value=str(data.get("person_relatives_text", "")))
+       value=_sval("person_relatives_text"))
 
     y = row_y - 16
 
     def section_header(title_text: str, checkbox_name: str, y_pos: float, checked: bool) -> float:
         box_size = 12
         CB(checkbox_name, title_text, left, y_pos - box_size, box_size, checked)
-        _text(c, left + box_size + 6, y_pos - 10, title_text, size=11, bold=True)
+        T(left + box_size + 6, y_pos - 10, title_text, size=11, bold=True)
         return y_pos - 18
 
     def paragraph_area(label: str, name: str, y_pos: float, height: float, value: str) -> float:
-        _text(c, left, y_pos - 12, label)
+        T(left, y_pos - 12, label)
         bx_y = y_pos - 12 - height
         c.rect(left, bx_y, col1 + col2 + col3, height, stroke=1, fill=0)
         TF(name, label, left + 4, bx_y + 4, col1 + col2 + col3 - 8, height - 8, multiline=True, value=value)
         return bx_y - 14
 
-    y = section_header(i18n.get("section.erst", "Erstzuweisung"), "erst_checked", y, checked=_booly(data.get("erst_checked")))
-    y = paragraph_area(i18n.get("erst.gruende", "Gründe …"), "erst_gruende", y, height=70, value=str(data.get("erst_gruende", "")))
+    y = section_header(labels.section_erst, "erst_checked", y, checked=_cval("erst_checked"))
+    y = paragraph_area(labels.erst_gruende, "erst_gruende", y, height=70, value=_sval("erst_gruende"))
 
-    y = section_header(i18n.get("section.unterb", "Zuweisung nach Unterbrechung"), "unterb_checked", y, checked=_booly(data.get("unterb_checked")))
-    y = paragraph_area(i18n.get("unterb.gruende", "Gründe …"), "unterb_gruende", y, height=70, value=str(data.get("unterb_gruende", "")))
+    y = section_header(labels.section_unterb, "unterb_checked", y, checked=_cval("unterb_checked"))
+    y = paragraph_area(labels.unterb_gruende, "unterb_gruende", y, height=70, value=_sval("unterb_gruende"))
 
-    y = section_header(i18n.get("section.verl", "Verlängerung der Zuweisung"), "verl_checked", y, checked=_booly(data.get("verl_checked")))
-    _text(c, left, y - 12, f"{i18n.get('verl.endet_am', 'Endet am')}:")
-    TF("verl_endet_am", i18n.get("verl.endet_am", "Endet am"), left + 320, y - 16, 150, 16, value=str(data.get("verl_endet_am", "")))
+    y = section_header(labels.section_verl, "verl_checked", y, checked=_cval("verl_checked"))
+    T(left, y - 12, f"{labels.verl_endet_am}:")
+    TF("verl_endet_am", labels.verl_endet_am, left + 320, y - 16, 150, 16, value=_sval("verl_endet_am"))
     y -= 28
-    _text(c, left, y - 12, "Es ist mir nicht gelungen, eine Wohnung anzumieten oder woanders unterzukommen.")
+    T(left, y - 12, "Es ist mir nicht gelungen, eine Wohnung anzumieten oder woanders unterzukommen.")
     y -= 22
 
-    y = section_header(i18n.get("section.wechsel", "Wechsel des Wohnheimes"), "wechsel_checked", y, checked=_booly(data.get("wechsel_checked")))
-    y = paragraph_area(i18n.get("wechsel.gruende", "Ich/Wir benötige/n …"), "wechsel_gruende", y, height=170, value=str(data.get("wechsel_gruende", "")))
+    y = section_header(labels.section_wechsel, "wechsel_checked", y, checked=_cval("wechsel_checked"))
+    y = paragraph_area(labels.wechsel_gruende, "wechsel_gruende", y, height=170, value=_sval("wechsel_gruende"))
 
-    _text(c, left, y - 12, i18n.get("field.ort", "Ort") + ":")
-    TF("stadt", i18n.get("field.ort", "Ort"), left + 50, y - 16, 150, 16, value=str(data.get("stadt", "")))
+    T(left, y - 12, labels.ort + ":")
+    TF("stadt", labels.ort, left + 50, y - 16, 150, 16, value=_sval("stadt"))
 
-    _text(c, left + 220, y - 12, i18n.get("field.datum", "Datum") + ":")
-    TF("datum", i18n.get("field.datum", "Datum"), left + 270, y - 16, 120, 16, value=str(data.get("datum", "")))
+    T(left + 220, y - 12, labels.datum + ":")
+    TF("datum", labels.datum, left + 270, y - 16, 120, 16, value=_sval("datum"))
     y -= 36
 
-    _text(c, left, y - 12, i18n.get("signature.title", "Unterschrift") + ":")
+    T(left, y - 12, labels.signature + ":")
     sig_x, sig_y, sig_w, sig_h = left + 70, y - 36, 180, 28
     raw_sig = data.get("signature_bytes")
 
@@ -228,7 +286,10 @@ def build_pdf_interactive_obdachlosigkeit(
     else:
         c.rect(sig_x, sig_y, sig_w, sig_h, stroke=1, fill=0)
 
+    _emit_texts(c, text_runs)
+    if form_fields:
+        _emit_fields(c, form_fields)
+
     c.showPage()
     c.save()
-    buf.seek(0)
-    return buf.read()
+    return None if output is not None else buf.getvalue()
@@ -1,5 +1,5 @@
 from io import BytesIO
-from PIL import Image as PILImage, ImageChops
+from PIL import Image as PILImage
 from reportlab.lib.pagesizes import A4
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Image as RLImage,
@@ -8,6 +8,23 @@ from reportlab.platypus import (
 from reportlab.lib.styles import getSampleStyleSheet
 from modules.pdf_utils import base_table_style
 from modules.signature_utils import build_signature_block
+from modules.image_utils import trim_whitespace
+
+# built once per process; style objects are read-only during builds
+_STYLES = getSampleStyleSheet()
+_TABLE_STYLE = base_table_style()
+_PERSON_COLW = (100, 350)
+
+
+def _person_rows(name, vorname, geb, addr):
+    """Rows for the two identical person tables (Vollmachtgeber and
+    Bevollmächtigter)."""
+    return (
+        ("Name:", name),
+        ("Vorname:", vorname),
+        ("Geburtsdatum:", geb),
+        ("Anschrift:", addr),
+    )
 
 
 def _trim_whitespace(img: PILImage.Image) -> PILImage.Image:
@@ -19,24 +36,19 @@ def _trim_whitespace(img: PILImage.Image) -> PILImage.Image:
     Returns:
         PILImage.Image: The cropped image without extra whitespace or transparent space.
     """
-    if img.mode in ("LA", "RGBA"):
-        alpha = img.split()[-1]
-        bbox = alpha.getbbox()
-        return img.crop(bbox) if bbox else img
-
-    rgb = img.convert("RGB")
-    bg = PILImage.new("RGB", rgb.size, (255, 255, 255))
-    diff = ImageChops.difference(rgb, bg)
-    bbox = diff.getbbox()
-    return img.crop(bbox) if bbox else img
+    # delegate to the shared NumPy bounding-box scan instead of the old
+    # ImageChops.difference pass (full-frame allocation + diff image)
+    return trim_whitespace(img)
 
 
 def build_pdf(
         data: dict,
         i18n: dict,
         pdf_options: dict,
-        signature_bytes: bytes | None = None
-) -> bytes:
+        signature_bytes: bytes | None = None,
+        *,
+        output=None
+) -> bytes | None:
     """Generate a PDF document containing authorization details.
 
     Args:
@@ -44,11 +56,12 @@ def build_pdf(
         i18n (dict): Dictionary for internationalization, providing localized strings.
         pdf_options (dict): Options for PDF layout, margins, and signature display settings.
         signature_bytes (bytes | None, optional): Image data for the signature. Defaults to None.
+        output (BinaryIO | None): Seekable binary stream to write the PDF to directly.
 
     Returns:
-        bytes: The generated PDF file as a byte stream.
+        bytes | None: The generated PDF file as bytes, or None when streamed to `output`.
     """
-    buf = BytesIO()
+    buf = BytesIO() if output is None else output
     doc = SimpleDocTemplate(
         buf,
         pagesize=A4,
@@ -58,10 +71,12 @@ def build_pdf(
         bottomMargin=pdf_options.get("bottomMargin", 36),
     )
 
-    styles = getSampleStyleSheet()
+    styles = _STYLES
     elems = [
+        # Title style is already Helvetica-Bold — plain text keeps the
+        # paraparser from chewing through redundant <b> markup
         Paragraph(
-            f"<b>{i18n.get(pdf_options.get('title_i18n', 'app.title'), 'Vollmacht')}</b>",
+            i18n.get(pdf_options.get('title_i18n', 'app.title'), 'Vollmacht'),
             styles["Title"]
         ),
         Paragraph(
@@ -73,29 +88,23 @@ def build_pdf(
         Paragraph("Vollmachtgeber", styles["Normal"]),
     ]
 
-    table_style = base_table_style()
+    table_style = _TABLE_STYLE
 
-    tbl1 = Table(
-        [
-            ["Name:", data.get("vg_name", "")],
-            ["Vorname:", data.get("vg_vorname", "")],
-            ["Geburtsdatum:", data.get("vg_geb", "")],
-            ["Anschrift:", data.get("vg_addr", "")],
-        ],
-        colWidths=[100, 350]
-    )
-    tbl1.setStyle(table_style)
-
-    tbl2 = Table(
-        [
-            ["Name:", data.get("b_name", "")],
-            ["Vorname:", data.get("b_vorname", "")],
-            ["Geburtsdatum:", data.get("b_geb", "")],
-            ["Anschrift:", data.get("b_addr", "")],
-        ],
-        colWidths=[100, 350]
-    )
-    tbl2.setStyle(table_style)
+    # hoist the field lookups once; the table rows below are then plain
+    # local loads
+    get = data.get
+    vg_name, vg_vorname = get("vg_name", ""), get("vg_vorname", "")
+    vg_geb, vg_addr = get("vg_geb", ""), get("vg_addr", "")
+    b_name, b_vorname = get("b_name", ""), get("b_vorname", "")
+    b_geb, b_addr = get("b_geb", ""), get("b_addr", "")
+
+    # style via the constructor assigns directly; setStyle would redo the
+    # command processing after construction
+    tbl1 = Table(_person_rows(vg_name, vg_vorname, vg_geb, vg_addr),
+                 colWidths=_PERSON_COLW, style=table_style)
+
+    tbl2 = Table(_person_rows(b_name, b_vorname, b_geb, b_addr),
+                 colWidths=_PERSON_COLW, style=table_style)
 
     elems += [
         tbl1,
@@ -116,7 +125,7 @@ def build_pdf(
         ),
         Spacer(1, 24),
         Paragraph(
-            f"{data.get('stadt', '')}, den {data.get('datum', '')}",
+            f"{get('stadt', '')}, den {get('datum', '')}",
             styles["Normal"]
         ),
         Spacer(1, 18),
@@ -132,5 +141,4 @@ def build_pdf(
     elems += [Indenter(left=0), KeepTogether(sig_block), Indenter(left=0)]
 
     doc.build(elems)
-    buf.seek(0)
-    return buf.read()
+    return None if output is not None else buf.getvalue()
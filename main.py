@@ -5,9 +5,11 @@ import os
 import sys
 import json
 import argparse
+import functools
 import subprocess
 from pathlib import Path
 
+@functools.cache
 def find_app_file(cli_app: str | None) -> Path:
     """
     Resolve the app file path by priority:
@@ -22,10 +24,13 @@ def find_app_file(cli_app: str | None) -> Path:
         print(f"[main] --app provided but not found: {p}")
         sys.exit(1)
 
+    # One directory scan instead of a stat per candidate file
+    cwd_names = {entry.name for entry in os.scandir(".")}
+
     # Read serve-config.json if present
     for cfg_name in ("serve-config.json", "serve_config.json", ".serve-config.json"):
-        cfg_path = Path(cfg_name)
-        if cfg_path.exists():
+        if cfg_name in cwd_names:
+            cfg_path = Path(cfg_name)
             try:
                 data = json.loads(cfg_path.read_text(encoding="utf-8"))
                 for k in ("main_file", "streamlit_app", "app"):
@@ -39,9 +44,8 @@ def find_app_file(cli_app: str | None) -> Path:
                 print(f"[main] Warning: failed reading {cfg_name}: {e}")
 
     # Fallback: app.py
-    p = Path("app.py")
-    if p.exists():
-        return p.resolve()
+    if "app.py" in cwd_names:
+        return Path("app.py").resolve()
 
     print("[main] Could not find an app file. Provide --app or create app.py")
     sys.exit(1)
@@ -81,6 +85,14 @@ def run_streamlit(app_path: Path, port: int, headless: bool, extra: list[str]):
     print("Running:", app_path)
     print(f"Port: {port}  Headless: {headless}")
     # Example: streamlit accepts more flags; pass via: py -m main -- --server.address 0.0.0.0
+
+    if sys.platform != "win32":
+        # Replace the launcher process image entirely: keeps the parent
+        # interpreter from sitting resident for the app's lifetime and
+        # avoids signal forwarding between launcher and Streamlit.
+        # Does not return on success.
+        os.execvpe(cmd[0], cmd, env)
+    # On Windows exec leaves a broken console, so keep the child process.
     return subprocess.call(cmd, env=env)
 
 def main():
@@ -1,20 +1,111 @@
 # modules/form_loader.py
 import os, json, importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 FORMS_DIR = Path(__file__).resolve().parent.parent / "forms"
 
 class LoadedForm:
-    def __init__(self, key, name, schema, i18n, builder_module):
+    def __init__(self, key, name, schema, i18n, builder_path):
         self.key = key                # ex: "vollmacht"
         self.name = name              # display name
         self.schema = schema          # dict
         self.i18n = i18n              # dict
-        self.builder = builder_module # module with build_pdf(...)
+        self._builder_path = builder_path
+        self._builder = None
+        # pre-resolved render/validation plan (keys + labels computed once)
+        self.compiled_sections = compile_schema(schema, i18n)
+        self.render_plan = compile_render_plan(self.compiled_sections)
+
+    @property
+    def builder(self):
+        """Builder module, loaded on first use — executing every form's
+        builder.py pulls in the ReportLab/PIL import graph, which is too
+        heavy to pay at discovery time for forms that are never rendered."""
+        if self._builder is None:
+            try:
+                # go through the normal import machinery so the cached
+                # __pycache__ bytecode is reused across app restarts
+                self._builder = importlib.import_module(f"forms.{self.key}.builder")
+            except ImportError:
+                # form dir without __init__.py, or repo root not on
+                # sys.path — fall back to loading from the file path
+                self._builder = _load_py_module(self._builder_path)
+        return self._builder
+
+
+def compile_schema(schema: dict, i18n: dict) -> list:
+    """Pre-resolve section titles, field keys and labels once at load time.
+
+    Returns a list of (section_title, fields) pairs where each field is a
+    (full_key, label, type, placeholder, required) tuple, so the UI render
+    loop and validation don't re-do dict lookups on every rerun.
+    """
+    compiled = []
+    for section in schema.get("sections", []):
+        sec_key = section.get("key", "")
+        title = i18n.get(section.get("title_i18n", sec_key), sec_key)
+        fields = []
+        for fld in section.get("fields", []):
+            fkey = fld.get("key", "")
+            fields.append((
+                f"{sec_key}_{fkey}",
+                i18n.get(fld.get("label_i18n", fkey), fkey),
+                fld.get("type", "text"),
+                fld.get("placeholder", ""),
+                bool(fld.get("required")),
+            ))
+        compiled.append((title, fields))
+    return compiled
+
+
+def compile_render_plan(compiled_sections: list, text_per_row: int = 2) -> list:
+    """Map each compiled field to its Streamlit widget name + kwargs.
+
+    The UI loop then just calls getattr(st, widget)(**kwargs) without any
+    per-field type dispatch or dict lookups during reruns. Runs of
+    consecutive text inputs are grouped into ("row", (...)) entries so the
+    UI can lay them out side by side in st.columns and batch the widget
+    traffic per row.
+    """
+    plan = []
+    for title, fields in compiled_sections:
+        widgets = []
+        run = []
+
+        def _flush_run():
+            if len(run) > 1:
+                widgets.append(("row", tuple(run)))
+            elif run:
+                widgets.append(run[0])
+            run.clear()
+
+        for key, label, ftype, placeholder, _required in fields:
+            if ftype == "textarea":
+                _flush_run()
+                widgets.append(("text_area", {"label": label, "placeholder": placeholder, "key": key}))
+            elif ftype == "checkbox":
+                _flush_run()
+                widgets.append(("checkbox", {"label": label, "value": False, "key": key}))
+            else:
+                run.append(("text_input", {"label": label, "placeholder": placeholder, "key": key}))
+                if len(run) == text_per_row:
+                    _flush_run()
+        _flush_run()
+        plan.append((title, widgets))
+    return plan
+
+# optional accelerated JSON parser; orjson takes the raw bytes directly,
+# the stdlib fallback accepts bytes as well since Python 3.6
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 def _load_json(p: Path, default=None):
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        return _json_loads(p.read_bytes())
     except FileNotFoundError:
         return default or {}
 
@@ -24,30 +115,38 @@ def _load_py_module(py_path: Path):
     spec.loader.exec_module(mod)  # type: ignore
     return mod
 
+def _load_one_form(d: Path, preferred_lang: str) -> LoadedForm | None:
+    key = d.name
+    builder_py = d / "builder.py"
+    if not builder_py.exists():
+        # skip invalid form folder
+        return None
+
+    schema = _load_json(d / "schema.json", {})
+
+    # pick i18n file: preferred -> en -> de -> ar -> first existing
+    candidates = [f"i18n.{preferred_lang}.json", "i18n.en.json", "i18n.de.json", "i18n.ar.json"]
+    i18n = {}
+    for fname in candidates:
+        path = d / fname
+        if path.exists():
+            i18n = _load_json(path, {})
+            break
+
+    display_name = i18n.get("app.title") or schema.get("title") or key
+    return LoadedForm(key, display_name, schema, i18n, builder_py)
+
+
 def discover_forms(preferred_lang="de") -> dict[str, LoadedForm]:
     forms: dict[str, LoadedForm] = {}
     if not FORMS_DIR.exists():
         return forms
 
-    for d in sorted([p for p in FORMS_DIR.iterdir() if p.is_dir()]):
-        key = d.name
-        schema = _load_json(d / "schema.json", {})
-
-        # pick i18n file: preferred -> en -> de -> ar -> first existing
-        candidates = [f"i18n.{preferred_lang}.json", "i18n.en.json", "i18n.de.json", "i18n.ar.json"]
-        i18n = {}
-        for fname in candidates:
-            path = d / fname
-            if path.exists():
-                i18n = _load_json(path, {})
-                break
-
-        builder_py = d / "builder.py"
-        if not builder_py.exists():
-            # skip invalid form folder
-            continue
-        builder_mod = _load_py_module(builder_py)
-
-        display_name = i18n.get("app.title") or schema.get("title") or key
-        forms[key] = LoadedForm(key, display_name, schema, i18n, builder_mod)
+    dirs = sorted(p for p in FORMS_DIR.iterdir() if p.is_dir())
+    # per-form loading is independent file I/O, so overlap the reads;
+    # mapping over the sorted list keeps the result order deterministic
+    with ThreadPoolExecutor(max_workers=min(8, max(len(dirs), 1))) as ex:
+        for form in ex.map(_load_one_form, dirs, [preferred_lang] * len(dirs)):
+            if form is not None:
+                forms[form.key] = form
     return forms
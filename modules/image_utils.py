@@ -1,14 +1,68 @@
-from PIL import Image, ImageChops
+import numpy as np
+from PIL import Image
+
+# rows/columns examined per step when scanning in from an edge; large
+# enough to amortize the ufunc call, small next to typical margins
+_TRIM_CHUNK = 64
+
+
+def _scan_in(ink, n, step=_TRIM_CHUNK):
+    """Index of the first slice with ink, scanning forward in chunks.
+
+    `ink(lo, hi)` returns a 1D bool array marking which rows (or columns)
+    in [lo, hi) contain ink. Blank margins are skipped chunk by chunk, so
+    the interior of a mostly-white image is never reduced at all.
+    """
+    for lo in range(0, n, step):
+        hits = ink(lo, min(lo + step, n))
+        if hits.any():
+            return lo + int(hits.argmax())
+    return None
+
+
+def _scan_back(ink, n, step=_TRIM_CHUNK):
+    """Index of the last slice with ink, scanning backward in chunks."""
+    for hi in range(n, 0, -step):
+        lo = max(hi - step, 0)
+        hits = ink(lo, hi)
+        if hits.any():
+            return lo + len(hits) - 1 - int(hits[::-1].argmax())
+    return None
+
 
 def trim_whitespace(img: Image.Image) -> Image.Image:
-    """Trim white or transparent margins from an image."""
+    """Trim white or transparent margins from an image.
+
+    Each bounding-box edge is found by scanning inward from that edge in
+    chunks of rows/columns (alpha channel for LA/RGBA, any non-white
+    channel otherwise). Only the margins are ever touched — the ink
+    interior is skipped — instead of reducing the whole pixel buffer.
+    """
     if img.mode in ("LA", "RGBA"):
-        alpha = img.split()[-1]
-        bbox = alpha.getbbox()
-        return img.crop(bbox) if bbox else img
-
-    rgb = img.convert("RGB")
-    bg = Image.new("RGB", rgb.size, (255, 255, 255))
-    diff = ImageChops.difference(rgb, bg)
-    bbox = diff.getbbox()
-    return img.crop(bbox) if bbox else img
+        plane = np.asarray(img)[..., -1]
+
+        def row_ink(lo, hi):
+            return (plane[lo:hi] != 0).any(axis=1)
+
+        def col_ink(lo, hi):
+            return (plane[:, lo:hi] != 0).any(axis=0)
+    else:
+        arr = np.asarray(img.convert("RGB"))
+
+        def row_ink(lo, hi):
+            return (arr[lo:hi] != 255).any(axis=(1, 2))
+
+        def col_ink(lo, hi):
+            return (arr[:, lo:hi] != 255).any(axis=(0, 2))
+
+    h, w = img.height, img.width
+    y0 = _scan_in(row_ink, h)
+    if y0 is None:
+        # fully blank — keep the image rather than cropping to nothing
+        return img
+    y1 = _scan_back(row_ink, h) + 1
+    x0 = _scan_in(col_ink, w)
+    x1 = _scan_back(col_ink, w) + 1
+    if x0 == 0 and y0 == 0 and x1 == w and y1 == h:
+        return img
+    return img.crop((x0, y0, x1, y1))
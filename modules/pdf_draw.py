@@ -0,0 +1,122 @@
+# modules/pdf_draw.py
+# Shared low-level canvas helpers for the interactive (AcroForm) builders,
+# kept here so form modules don't each carry their own copy.
+from reportlab.lib import colors
+
+FF_MULTILINE = 1 << 12  # 4096
+
+
+def _pt(v: float) -> float:
+    return float(v)
+
+
+def _draw_box(c, x, y, w, h, *, fill=None, stroke=1, dash=None):
+    if dash:
+        c.setDash(dash, 0)
+    else:
+        c.setDash()
+    if fill is not None:
+        c.setFillColor(fill)
+        c.rect(x, y, w, h, stroke=stroke, fill=1)
+        c.setFillColor(colors.black)
+    else:
+        c.rect(x, y, w, h, stroke=stroke, fill=0)
+
+
+def _draw_frame(c, segments=(), rects=()):
+    """Stroke a static frame (lines + boxes) as one path instead of one
+    PDF operator per line."""
+    p = c.beginPath()
+    for (x1, y1, x2, y2) in segments:
+        p.moveTo(x1, y1)
+        p.lineTo(x2, y2)
+    for (x, y, w, h) in rects:
+        p.rect(x, y, w, h)
+    c.drawPath(p, stroke=1, fill=0)
+
+
+def _set_font(c, name, size):
+    """Call setFont only on an actual change — avoids repeating the Tf
+    operator in the content stream."""
+    if c._fontname != name or c._fontsize != size:
+        c.setFont(name, size)
+
+
+def _text(c, x, y, txt, size=10, bold=False):
+    _set_font(c, "Helvetica-Bold" if bold else "Helvetica", size)
+    c.drawString(x, y, txt)
+
+
+def _checkbox_interactive(c, name, tooltip, x, y, size=12, checked=False):
+    c.acroForm.checkbox(
+        name=name,
+        tooltip=tooltip,
+        x=x,
+        y=y,
+        size=size,
+        borderStyle="solid",
+        borderWidth=0,
+        checked=bool(checked),
+        buttonStyle="check",
+    )
+
+
+def _emit_texts(c, runs):
+    """Draw queued (font, size, x, y, text) label runs with a single
+    TextObject, grouped by font so each Tf operator appears once."""
+    if not runs:
+        return
+    t = c.beginText()
+    cur = None
+    for font, size, x, y, txt in sorted(runs, key=lambda r: (r[0], r[1])):
+        if (font, size) != cur:
+            t.setFont(font, size)
+            cur = (font, size)
+        t.setTextOrigin(x, y)
+        t.textOut(txt)
+    c.drawText(t)
+
+
+def _emit_fields(c, fields):
+    """Create queued AcroForm fields in one tight pass.
+
+    Entries are ("cb", name, tooltip, x, y, size, checked) or
+    ("tf", name, tooltip, x, y, w, h, multiline, value). Binding the
+    acroForm methods once avoids the per-field property and attribute
+    lookups of calling c.acroForm.checkbox/textfield individually.
+    """
+    af = c.acroForm
+    checkbox = af.checkbox
+    textfield = af.textfield
+    for f in fields:
+        if f[0] == "cb":
+            _, name, tooltip, x, y, size, checked = f
+            checkbox(
+                name=name, tooltip=tooltip, x=x, y=y, size=size,
+                borderStyle="solid", borderWidth=0,
+                checked=bool(checked), buttonStyle="check",
+            )
+        else:
+            _, name, tooltip, x, y, w, h, multiline, value = f
+            textfield(
+                name=name, tooltip=tooltip, x=x, y=y, width=w, height=h,
+                borderStyle="inset", borderWidth=0, forceBorder=False,
+                fieldFlags=FF_MULTILINE if multiline else 0, value=value,
+                fillColor=colors.white, textColor=colors.black,
+            )
+
+
+def _textfield_interactive(c, name, tooltip, x, y, w, h, *, multiline=False, value: str = ""):
+    flags = FF_MULTILINE if multiline else 0
+    c.acroForm.textfield(
+        name=name,
+        tooltip=tooltip,
+        x=x, y=y, width=w, height=h,
+        borderStyle="inset",
+        borderWidth=0,
+        forceBorder=False,
+        fieldFlags=flags,
+        value=value,
+        fillColor=colors.white,
+        textColor=colors.black,
+    )
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 
 from reportlab.pdfgen import canvas
@@ -10,24 +14,55 @@ from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.utils import ImageReader
 from reportlab.platypus import Paragraph
-from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from PIL import Image as PILImage
 
 from modules.image_utils import trim_whitespace  # قص الهوامش الموحّد
+from modules.pdf_draw import _set_font
+from modules.pdf_utils import _truthy
+from modules.signature_utils import _fit_box
 
 FF_MULTILINE = 1 << 12  # 4096
 
+_BLACK = (0.0, 0.0, 0.0)
+
+# built once per process; mutating styles["Normal"] per render leaked the
+# overrides into every other getSampleStyleSheet user
+_STYLES = getSampleStyleSheet()
+_PSTYLE = ParagraphStyle(
+    "layoutN", parent=_STYLES["Normal"],
+    fontName="Helvetica", fontSize=10, leading=12,
+)
+
+
+# optional accelerated JSON parser, same fallback as modules/form_loader
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+@lru_cache(maxsize=64)
+def _load_layout(path_str: str, mtime_ns: int):
+    """Parse layout.json once per (path, mtime); repeat builds of the same
+    form skip the read + parse entirely. The mtime in the key makes edits
+    show up without restarting. Wrapped read-only since the dict is shared
+    across calls."""
+    try:
+        return MappingProxyType(_json_loads(Path(path_str).read_bytes()))
+    except Exception:
+        return None
+
 
 def _read_layout(form_key: Optional[str]) -> Optional[Dict[str, Any]]:
     if not form_key:
         return None
     p = Path(f"forms/{form_key}/layout.json")
-    if p.exists():
-        try:
-            return json.loads(p.read_text(encoding="utf-8"))
-        except Exception:
-            return None
-    return None
+    try:
+        mtime_ns = p.stat().st_mtime_ns
+    except OSError:
+        return None
+    return _load_layout(str(p), mtime_ns)
 
 
 def _label_from_i18n(i18n: Dict[str, str], item: Dict[str, Any], fallback_key: str = "name") -> str:
@@ -40,15 +75,40 @@ def _text_from_i18n(i18n: Dict[str, str], item: Dict[str, Any], key: str = "text
     return item.get(key, "")
 
 
-def _booly(x: Any) -> bool:
-    s = str(x or "").strip().lower()
-    return s in {"1", "true", "y", "yes", "ja", "on", "x", "✓", "checked"}
-
-
-def _fill_box(c: canvas.Canvas, x: float, y: float, w: float, h: float, *, fill_rgb=(1.0, 1.0, 1.0)) -> None:
-    c.setFillColorRGB(*fill_rgb)
-    c.rect(x, y, w, h, stroke=1, fill=1)
-    c.setFillColor(colors.black)
+# page-sorted fields plus their resolved labels, keyed per (layout, i18n)
+# pair — the layout dict is cached across builds, so repeat renders skip
+# the per-field i18n lookups and the sort entirely
+_PLAN_CACHE: Dict[tuple, tuple] = {}
+
+
+def _layout_plan(layout: Dict[str, Any], i18n: Dict[str, str]) -> tuple:
+    key = (id(layout), id(i18n))
+    cached = _PLAN_CACHE.get(key)
+    # the entry keeps the keyed objects alive and re-checks identity, so a
+    # recycled id() from a garbage-collected dict can't serve a stale plan
+    if cached is not None and cached[0] is layout and cached[1] is i18n:
+        return cached[2], cached[3]
+    # stable sort by page so out-of-order entries don't skip pages;
+    # the within-page author order (and thus draw order) is preserved
+    fields = tuple(sorted(
+        layout.get("fields", []) or [],
+        key=lambda f: int(f.get("page", 1)),
+    ))
+    # intern the resolved strings: labels like "Name" or "Datum" repeat
+    # across fields and forms, so tooltips share one object per text
+    labels = tuple(
+        (sys.intern(_label_from_i18n(i18n, f)), sys.intern(_text_from_i18n(i18n, f)))
+        for f in fields
+    )
+    if len(_PLAN_CACHE) > 8:
+        _PLAN_CACHE.clear()
+    _PLAN_CACHE[key] = (layout, i18n, fields, labels)
+    return fields, labels
+
+
+# kept as a name for the generated renderers; the shared _truthy has the
+# bool/None/0 fast paths so checkbox values skip the str round-trip
+_booly = _truthy
 
 
 def build_interactive_pdf(
@@ -60,12 +120,13 @@ def build_interactive_pdf(
     form_key: Optional[str] = None,
     form_data: Optional[Dict[str, Any]] = None,
     flatten: bool = False,
-) -> bytes:
+    output=None,
+) -> bytes | None:
     pdf_options = pdf_options or {}
     data = form_data or {}
     page_w, page_h = A4
 
-    mem = BytesIO()
+    mem = BytesIO() if output is None else output
     c = canvas.Canvas(mem, pagesize=A4)
     c.setAuthor("vollmacht_all")
     if file_title:
@@ -74,183 +135,256 @@ def build_interactive_pdf(
     layout = _read_layout(form_key or schema.get("__form_key__"))
     if layout:
         _render_by_layout_json(c, layout, i18n, page_w, page_h, data, flatten=flatten)
-        c.save()
-        mem.seek(0)
-        return mem.read()
-
-    _render_auto_layout(c, schema, i18n, pdf_options, page_w, page_h, data, flatten=flatten)
+    else:
+        _render_auto_layout(c, schema, i18n, pdf_options, page_w, page_h, data, flatten=flatten)
     c.save()
-    mem.seek(0)
-    return mem.read()
-
-
-def _render_by_layout_json(
-    c: canvas.Canvas,
+    # getvalue() makes one copy; the old seek(0)+read() duplicated the
+    # whole buffer a second time
+    return None if output is not None else mem.getvalue()
+
+
+def _draw_image_field(c, data, value_key, x, y, w, h, trim, mode):
+    raw = data.get(value_key)
+    if not raw:
+        return
+    try:
+        pil = PILImage.open(BytesIO(raw))
+        if trim:
+            # trim in the source mode — an upfront RGBA convert would make
+            # RGB scans fully opaque and defeat the alpha-based trim
+            pil = trim_whitespace(pil)
+        if pil.mode not in ("RGB", "RGBA"):
+            pil = pil.convert("RGBA")
+        w_img, h_img = pil.size
+        dw, dh = _fit_box(w_img, h_img, w, h, mode)
+        c.drawImage(ImageReader(pil), x, y, width=dw, height=dh, mask="auto")
+    except Exception:
+        pass
+
+
+def _flat_para(c, val, x, y, w, h):
+    para = Paragraph(val.replace("\n", "<br/>"), _PSTYLE)
+    para.wrapOn(c, w - 2, h - 2)
+    para.drawOn(c, x + 1, y + 1)
+
+
+@lru_cache(maxsize=8)
+def _bg_reader(path: str) -> ImageReader:
+    """One decoded ImageReader per background path. ReportLab keys image
+    XObjects on the reader object, so reusing it both skips the per-page
+    PNG decode and emits the background bitmap once per document."""
+    return ImageReader(path)
+
+
+# compiled render functions keyed per (layout, i18n, flatten, draw_boxes);
+# bounded like the other id()-keyed caches in this tree
+_COMPILED_CACHE: Dict[tuple, Any] = {}
+
+
+def _compile_layout(
     layout: Dict[str, Any],
     i18n: Dict[str, str],
-    page_w: float,
-    page_h: float,
-    data: Dict[str, Any],
     *,
-    flatten: bool = False,
-) -> None:
-    draw_boxes_interactive = bool(layout.get("draw_boxes", True)) and (not flatten)
-    fields: List[Dict[str, Any]] = list(layout.get("fields", []) or [])
-    backgrounds: List[str] = list(layout.get("backgrounds", []) or [])
-
-    styles = getSampleStyleSheet()
-    pstyle = styles["Normal"]
-    pstyle.fontName = "Helvetica"
-    pstyle.fontSize = 10
-    pstyle.leading = 12
-
-    def _draw_background(page_index: int) -> None:
-        if 0 <= page_index < len(backgrounds):
-            bg_path = backgrounds[page_index]
-            try:
-                c.drawImage(bg_path, 0, 0, width=page_w, height=page_h, preserveAspectRatio=False, mask="auto")
-            except Exception:
-                pass
-
-    c.setFont("Helvetica", 10)
-    current_page = 1
-    _draw_background(0)
-
-    for f in fields:
-        page = int(f.get("page", 1))
-        while page > current_page:
-            c.showPage()
-            c.setFont("Helvetica", 10)
-            current_page += 1
-            _draw_background(current_page - 1)
+    flatten: bool,
+    draw_boxes: bool,
+):
+    """Specialize the layout into a straight-line render function.
+
+    Field coordinates, types, labels and constant attributes are baked
+    into generated source once per cached layout, so repeat renders run
+    no per-field dict lookups, float conversions or kind dispatch — only
+    the form values (and images) stay runtime parameters. Canvas font
+    and fill state are tracked at generation time, so state operators
+    are emitted only where the static field sequence changes them.
+    """
+    key = (id(layout), id(i18n), flatten, draw_boxes)
+    cached = _COMPILED_CACHE.get(key)
+    # identity re-check as in _layout_plan: a recycled id() must not serve
+    # a function compiled for a different layout
+    if cached is not None and cached[0] is layout and cached[1] is i18n:
+        return cached[2]
+
+    fields, labels = _layout_plan(layout, i18n)
+    default_fill = layout.get("fill_rgb", (1.0, 1.0, 1.0))
+    consts: list = []  # non-literal objects referenced as K[i]
+    color_consts: dict = {}  # fill tuple -> K[i] expr, one Color per shade
+
+    def _const(obj) -> str:
+        consts.append(obj)
+        return f"K[{len(consts) - 1}]"
+
+    def _color_const(rgb: tuple) -> str:
+        expr = color_consts.get(rgb)
+        if expr is None:
+            expr = color_consts[rgb] = _const(colors.Color(*rgb))
+        return expr
+
+    src = ["def _render(c, data, draw_background):", "    draw_background(0)"]
+    emit = src.append
+    page = 1
+    font = None          # (name, size) active at this point in the stream
+    fill = _BLACK
+
+    def _need_font(name, size):
+        nonlocal font
+        if font != (name, size):
+            emit(f"    c.setFont({name!r}, {size!r})")
+            font = (name, size)
+
+    def _need_fill(col):
+        nonlocal fill
+        if col != fill:
+            if col == _BLACK:
+                emit("    c.setFillColor(colors.black)")
+            else:
+                emit(f"    c.setFillColorRGB({col[0]!r}, {col[1]!r}, {col[2]!r})")
+            fill = col
+
+    for f, (label, label_text) in zip(fields, labels):
+        fpage = int(f.get("page", 1))
+        while fpage > page:
+            emit("    c.showPage()")
+            page += 1
+            emit(f"    draw_background({page - 1})")
+            font = None
+            fill = _BLACK
 
         kind = (f.get("type") or "text").lower()
 
         if kind == "label":
-            txt = _text_from_i18n(i18n, f, key="text", i18n_key="text_i18n")
-            size = int(f.get("size", 10))
-            c.setFont("Helvetica-Bold" if f.get("bold") else "Helvetica", size)
-            c.drawString(float(f.get("x", 0)), float(f.get("y", 0)), txt)
-            c.setFont("Helvetica", 10)
+            _need_fill(_BLACK)
+            _need_font("Helvetica-Bold" if f.get("bold") else "Helvetica",
+                       int(f.get("size", 10)))
+            emit(f"    c.drawString({float(f.get('x', 0))!r}, "
+                 f"{float(f.get('y', 0))!r}, {label_text!r})")
             continue
 
         if kind == "line":
-            x1, y1 = float(f.get("x1", 0)), float(f.get("y1", 0))
-            x2, y2 = float(f.get("x2", 0)), float(f.get("y2", 0))
-            width = float(f.get("width", 0.8))
-            c.setLineWidth(width)
-            c.line(x1, y1, x2, y2)
+            emit(f"    c.setLineWidth({float(f.get('width', 0.8))!r})")
+            emit(f"    c.line({float(f.get('x1', 0))!r}, {float(f.get('y1', 0))!r}, "
+                 f"{float(f.get('x2', 0))!r}, {float(f.get('y2', 0))!r})")
             continue
 
+        x, y = float(f["x"]), float(f["y"])
         if kind == "rect":
-            x, y, w, h = float(f["x"]), float(f["y"]), float(f["w"]), float(f["h"])
-            c.setFillColorRGB(1, 1, 1)
-            c.rect(x, y, w, h, stroke=1, fill=0)
-            c.setFillColor(colors.black)
+            w, h = float(f["w"]), float(f["h"])
+            emit(f"    c.rect({x!r}, {y!r}, {w!r}, {h!r}, stroke=1, fill=0)")
             continue
 
-        x, y, w, h = float(f["x"]), float(f["y"]), float(f["w"]), float(f["h"])
-        label = _label_from_i18n(i18n, f)
+        w, h = float(f["w"]), float(f["h"])
+        value_key = f.get("value_from") or f.get("name")
 
         if kind == "image":
-            value_key = f.get("value_from") or f.get("name")
-            raw = data.get(value_key)
-            if raw:
-                try:
-                    pil = PILImage.open(BytesIO(raw)).convert("RGBA")
-                    if f.get("trim", True):
-                        pil = trim_whitespace(pil)
-                    mode = (f.get("scale_mode") or "fit").lower()
-                    w_box, h_box = w, h
-                    w_img, h_img = pil.size
-                    if mode == "stretch":
-                        dw, dh = w_box, h_box
-                    else:
-                        aspect = h_img / float(w_img or 1)
-                        dw = w_box
-                        dh = dw * aspect
-                        if dh > h_box:
-                            dh = h_box
-                            dw = dh / (aspect or 1)
-                    img = ImageReader(pil)
-                    c.drawImage(img, x, y, width=dw, height=dh, mask="auto")
-                except Exception:
-                    pass
+            emit(f"    _draw_image_field(c, data, {value_key!r}, {x!r}, {y!r}, "
+                 f"{w!r}, {h!r}, {bool(f.get('trim', True))!r}, "
+                 f"{(f.get('scale_mode') or 'fit').lower()!r})")
             continue
 
+        box_col = tuple(f.get("fill_rgb", default_fill))
+
         if kind == "checkbox":
-            checked = f.get("checked")
             if "checked_from" in f:
-                checked = _booly(data.get(f.get("checked_from")))
-            elif checked is None:
-                value_key = f.get("value_from") or f.get("name")
-                checked = _booly(data.get(value_key))
+                checked_expr = f"_booly(data.get({f.get('checked_from')!r}))"
+            elif f.get("checked") is not None:
+                checked_expr = repr(bool(f.get("checked")))
+            else:
+                checked_expr = f"_booly(data.get({value_key!r}))"
 
+            size = min(w, h)
             if flatten:
-                size = min(w, h)
-                c.rect(x, y, size, size, stroke=1, fill=0)
-                if checked:
-                    c.setFont("Helvetica", 12)
-                    c.drawString(x + 2, y + 1, "✓")
-                    c.setFont("Helvetica", 10)
+                emit(f"    c.rect({x!r}, {y!r}, {size!r}, {size!r}, stroke=1, fill=0)")
+                emit(f"    if {checked_expr}:")
+                emit("        c.setFont('Helvetica', 12)")
+                emit(f"        c.drawString({x + 2!r}, {y + 1!r}, '\u2713')")
+                font = None  # conditional branch leaves the font unknown
             else:
-                if draw_boxes_interactive:
-                    col = tuple(f.get("fill_rgb", layout.get("fill_rgb", (1.0, 1.0, 1.0))))
-                    _fill_box(c, x, y, min(w, h), min(w, h), fill_rgb=col)
-                c.acroForm.checkbox(
-                    name=f.get("name"),
-                    tooltip=label,
-                    x=x,
-                    y=y,
-                    size=min(w, h),
-                    borderStyle="solid",
-                    borderWidth=float(f.get("borderWidth", 0)),
-                    checked=bool(checked),
-                    buttonStyle=f.get("buttonStyle", "check"),
-                )
+                if draw_boxes:
+                    _need_fill(box_col)
+                    emit(f"    c.rect({x!r}, {y!r}, {size!r}, {size!r}, stroke=1, fill=1)")
+                emit(f"    c.acroForm.checkbox(name={f.get('name')!r}, tooltip={label!r}, "
+                     f"x={x!r}, y={y!r}, size={size!r}, borderStyle='solid', "
+                     f"borderWidth={float(f.get('borderWidth', 0))!r}, "
+                     f"checked={checked_expr}, buttonStyle={f.get('buttonStyle', 'check')!r})")
             continue
 
         # text / textarea
+        multiline = kind in ("textarea", "multiline")
+        value_expr = f"str(data.get({value_key!r}, {f.get('default', '')!r}) or '')"
         if flatten:
-            val = str(data.get(f.get("value_from") or f.get("name"), f.get("default", "")) or "")
-            styles = getSampleStyleSheet()
-            pstyle = styles["Normal"]
-            pstyle.fontName = "Helvetica"
-            pstyle.fontSize = 10
-            pstyle.leading = 12
-            if kind in ("textarea", "multiline"):
-                para = Paragraph(val.replace("\n", "<br/>"), pstyle)
-                para.wrapOn(c, w - 2, h - 2)
-                para.drawOn(c, x + 1, y + 1)
+            if multiline:
+                emit(f"    _flat_para(c, {value_expr}, {x!r}, {y!r}, {w!r}, {h!r})")
             else:
-                c.setFont("Helvetica", 10)
-                c.drawString(x + 1, y + h - 12, val)
+                _need_fill(_BLACK)
+                _need_font("Helvetica", 10)
+                emit(f"    c.drawString({x + 1!r}, {y + h - 12!r}, {value_expr})")
         else:
-            if draw_boxes_interactive:
-                col = tuple(f.get("fill_rgb", layout.get("fill_rgb", (1.0, 1.0, 1.0))))
-                _fill_box(c, x, y, w, h, fill_rgb=col)
-            flags = FF_MULTILINE if kind in ("textarea", "multiline") else 0
-            value_key = f.get("value_from") or f.get("name")
-            default_value = f.get("default", "")
-            value = str(data.get(value_key, default_value) or "")
-            col_tuple = f.get("fill_rgb", layout.get("fill_rgb", (1.0, 1.0, 1.0)))
-            fillColor = colors.Color(*col_tuple) if col_tuple else None
+            if draw_boxes:
+                _need_fill(box_col)
+                emit(f"    c.rect({x!r}, {y!r}, {w!r}, {h!r}, stroke=1, fill=1)")
+            fill_const = _color_const(box_col) if box_col else "None"
+            emit(f"    c.acroForm.textfield(name={f.get('name')!r}, tooltip={label!r}, "
+                 f"x={x!r}, y={y!r}, width={w!r}, height={h!r}, "
+                 f"borderStyle={f.get('borderStyle', 'inset')!r}, "
+                 f"borderWidth={float(f.get('borderWidth', 0))!r}, "
+                 f"forceBorder={bool(f.get('forceBorder', False))!r}, "
+                 f"fieldFlags={FF_MULTILINE if multiline else 0}, "
+                 f"value={value_expr}, fillColor={fill_const}, textColor=colors.black)")
+
+    ns = {
+        "colors": colors, "K": consts, "_booly": _booly,
+        "_draw_image_field": _draw_image_field, "_flat_para": _flat_para,
+    }
+    exec("\n".join(src), ns)
+    fn = ns["_render"]
+    if len(_COMPILED_CACHE) > 16:
+        _COMPILED_CACHE.clear()
+    _COMPILED_CACHE[key] = (layout, i18n, fn)
+    return fn
 
-            c.acroForm.textfield(
-                name=f.get("name"),
-                tooltip=label,
-                x=x,
-                y=y,
-                width=w,
-                height=h,
-                borderStyle=f.get("borderStyle", "inset"),
-                borderWidth=float(f.get("borderWidth", 0)),
-                forceBorder=bool(f.get("forceBorder", False)),
-                fieldFlags=flags,
-                value=value,
-                fillColor=fillColor,
-                textColor=colors.black,
-            )
+
+def _render_by_layout_json(
+    c: canvas.Canvas,
+    layout: Dict[str, Any],
+    i18n: Dict[str, str],
+    page_w: float,
+    page_h: float,
+    data: Dict[str, Any],
+    *,
+    flatten: bool = False,
+) -> None:
+    draw_boxes = bool(layout.get("draw_boxes", True)) and (not flatten)
+    # read-only iteration — no need to copy the decoded list
+    backgrounds: List[str] = layout.get("backgrounds") or []
+
+    # each unique background becomes one Form XObject; stamping a page is
+    # then a single Do operator instead of a transform + image draw
+    bg_forms: Dict[str, str] = {}
+
+    def _draw_background(page_index: int) -> None:
+        if not (0 <= page_index < len(backgrounds)):
+            return
+        path = backgrounds[page_index]
+        form_id = bg_forms.get(path)
+        if form_id is None:
+            form_id = f"bg{len(bg_forms)}"
+            try:
+                c.beginForm(form_id, lowerx=0, lowery=0,
+                            upperx=page_w, uppery=page_h)
+                c.drawImage(_bg_reader(path), 0, 0,
+                            width=page_w, height=page_h,
+                            preserveAspectRatio=False, mask="auto")
+                c.endForm()
+            except Exception:
+                # unreadable image — remember the failure, keep rendering
+                bg_forms[path] = ""
+                return
+            bg_forms[path] = form_id
+        if form_id:
+            c.doForm(form_id)
+
+    _compile_layout(layout, i18n, flatten=flatten, draw_boxes=draw_boxes)(
+        c, data, _draw_background
+    )
 
 
 def _render_auto_layout(
@@ -270,9 +404,23 @@ def _render_auto_layout(
     bottom = float(pdf_options.get("bottomMargin", 36))
     draw_boxes = bool(pdf_options.get("interactive_draw_boxes", True)) and (not flatten)
 
-    fill_rgb_opt = pdf_options.get("interactive_fill_rgb", (1.0, 1.0, 1.0))
+    fill_rgb_opt = tuple(pdf_options.get("interactive_fill_rgb", (1.0, 1.0, 1.0)))
     auto_fill = colors.Color(*fill_rgb_opt)
 
+    # fill color tracked as a local: all boxes share one color, so the
+    # rg set/reset pair previously emitted per box collapses to a single
+    # change whenever boxes and text alternate
+    cur_fill = _BLACK
+
+    def _fill(col):
+        nonlocal cur_fill
+        if col != cur_fill:
+            if col == _BLACK:
+                c.setFillColor(colors.black)
+            else:
+                c.setFillColorRGB(*col)
+            cur_fill = col
+
     title_key = pdf_options.get("title_i18n", "app.title")
     doc_title = i18n.get(title_key, "Interactive Form")
 
@@ -285,31 +433,26 @@ def _render_auto_layout(
     c.setFont("Helvetica-Bold", 14)
     c.drawString(x_label, y, doc_title)
     y -= 28
-    c.setFont("Helvetica", 10)
-
-    styles = getSampleStyleSheet()
-    pstyle = styles["Normal"]
-    pstyle.fontName = "Helvetica"
-    pstyle.fontSize = 10
-    pstyle.leading = 12
 
     def new_page():
         nonlocal y
         c.showPage()
-        c.setFont("Helvetica", 10)
         y = page_h - top
 
     def draw_text(label: str, name: str):
         nonlocal y
         if y - line_h < bottom:
             new_page()
+        _fill(_BLACK)
+        _set_font(c, "Helvetica", 10)
         c.drawString(x_label, y - 12, f"{label}:")
         if flatten:
             val = str(data.get(name, "") or "")
             c.drawString(x_field + 1, y - 12, val)
         else:
             if draw_boxes:
-                _fill_box(c, x_field, y - 16, field_w, 16, fill_rgb=fill_rgb_opt)
+                _fill(fill_rgb_opt)
+                c.rect(x_field, y - 16, field_w, 16, stroke=1, fill=1)
             c.acroForm.textfield(
                 name=name,
                 tooltip=label,
@@ -329,15 +472,18 @@ def _render_auto_layout(
         h = max(16 * rows + 4, 36)
         if y - h < bottom:
             new_page()
+        _fill(_BLACK)
+        _set_font(c, "Helvetica", 10)
         c.drawString(x_label, y - 12, f"{label}:")
         if flatten:
             val = str(data.get(name, "") or "")
-            para = Paragraph(val.replace("\n", "<br/>"), pstyle)
+            para = Paragraph(val.replace("\n", "<br/>"), _PSTYLE)
             para.wrapOn(c, field_w - 2, h - 8)
             para.drawOn(c, x_field + 1, y - h + 6)
         else:
             if draw_boxes:
-                _fill_box(c, x_field, y - h + 4, field_w, h - 8, fill_rgb=fill_rgb_opt)
+                _fill(fill_rgb_opt)
+                c.rect(x_field, y - h + 4, field_w, h - 8, stroke=1, fill=1)
             c.acroForm.textfield(
                 name=name,
                 tooltip=label,
@@ -361,13 +507,15 @@ def _render_auto_layout(
         if flatten:
             c.rect(x_field, y - 14, box_size, box_size, stroke=1, fill=0)
             if _booly(data.get(name)):
-                c.setFont("Helvetica", 12)
+                _set_font(c, "Helvetica", 12)
                 c.drawString(x_field + 2, y - 13, "✓")
-                c.setFont("Helvetica", 10)
+            _fill(_BLACK)
+            _set_font(c, "Helvetica", 10)
             c.drawString(x_field + box_size + 6, y - 12, label)
         else:
             if draw_boxes:
-                _fill_box(c, x_field, y - 14, box_size, box_size, fill_rgb=fill_rgb_opt)
+                _fill(fill_rgb_opt)
+                c.rect(x_field, y - 14, box_size, box_size, stroke=1, fill=1)
             c.acroForm.checkbox(
                 name=name,
                 tooltip=label,
@@ -378,6 +526,8 @@ def _render_auto_layout(
                 checked=_booly(data.get(name)),
                 buttonStyle="check",
             )
+            _fill(_BLACK)
+            _set_font(c, "Helvetica", 10)
             c.drawString(x_field + box_size + 6, y - 12, label)
         y -= line_h
 
@@ -385,17 +535,20 @@ def _render_auto_layout(
         nonlocal y
         if y - 20 < bottom:
             new_page()
-        c.setFont("Helvetica-Bold", 11)
+        _fill(_BLACK)
+        _set_font(c, "Helvetica-Bold", 11)
         c.drawString(x_label, y - 12, title)
-        c.setFont("Helvetica", 10)
         y -= 8
 
     for section in schema.get("sections", []):
         title = i18n.get(section.get("title_i18n", section.get("key", "")), section.get("key", ""))
         draw_section(title)
+        # one concatenation per field instead of re-formatting the
+        # section key every time
+        section_prefix = section["key"] + "_"
         for fld in section.get("fields", []):
             key = fld.get("key", "")
-            name = f"{section['key']}_{key}"
+            name = section_prefix + key
             label = i18n.get(fld.get("label_i18n", key), key)
             ftype = (fld.get("type") or "text").lower()
             if ftype in {"text", "input", "string"}:
@@ -412,12 +565,15 @@ def _render_auto_layout(
     if ("stadt_default" in misc) or ("date_placeholder" in misc):
         if y - 40 < bottom:
             new_page()
+        _fill(_BLACK)
+        _set_font(c, "Helvetica", 10)
         c.drawString(x_label, y - 12, i18n.get("field.ort", "Ort") + ":")
         if flatten:
             c.drawString(x_field + 1, y - 12, str(data.get("stadt", "") or ""))
         else:
             if draw_boxes:
-                _fill_box(c, x_field, y - 16, field_w / 2 - 10, 16, fill_rgb=fill_rgb_opt)
+                _fill(fill_rgb_opt)
+                c.rect(x_field, y - 16, field_w / 2 - 10, 16, stroke=1, fill=1)
             c.acroForm.textfield(
                 name="stadt",
                 tooltip=i18n.get("field.ort", "Ort"),
@@ -430,12 +586,14 @@ def _render_auto_layout(
                 fillColor=auto_fill,
                 textColor=colors.black,
             )
+        _fill(_BLACK)
         c.drawString(x_field + field_w / 2 + 10, y - 12, i18n.get("field.datum", "Datum") + ":")
         if flatten:
             c.drawString(x_field + field_w / 2 + 52, y - 12, str(data.get("datum", "") or ""))
         else:
             if draw_boxes:
-                _fill_box(c, x_field + field_w / 2 + 50, y - 16, field_w / 2 - 50, 16, fill_rgb=fill_rgb_opt)
+                _fill(fill_rgb_opt)
+                c.rect(x_field + field_w / 2 + 50, y - 16, field_w / 2 - 50, 16, stroke=1, fill=1)
             c.acroForm.textfield(
                 name="datum",
                 tooltip=i18n.get("field.datum", "Datum"),
@@ -448,3 +606,22 @@ def _render_auto_layout(
                 fillColor=auto_fill,
                 textColor=colors.black,
             )
+
+
+def _interactive_job(args):
+    schema, i18n, pdf_options, file_title, form_key, form_data, flatten = args
+    return build_interactive_pdf(
+        schema, i18n, pdf_options=pdf_options, file_title=file_title,
+        form_key=form_key, form_data=form_data, flatten=flatten,
+    )
+
+
+def build_interactive_pdfs(jobs: list, max_workers: int | None = None,
+                           chunksize: int = 4) -> list[bytes]:
+    """Batch-generate interactive PDFs on worker processes; each job is a
+    (schema, i18n, pdf_options, file_title, form_key, form_data, flatten)
+    tuple. Rendering is GIL-bound ReportLab work, so a process pool scales
+    close to linearly; each worker warms its own layout and compile caches
+    on first use and keeps them for the rest of the batch."""
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(_interactive_job, jobs, chunksize=chunksize))
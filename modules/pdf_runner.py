@@ -0,0 +1,75 @@
+# modules/pdf_runner.py
+"""Process-pool PDF builds with a bounded result cache.
+
+ReportLab rendering is CPU-bound Python code, so running it on the
+calling thread blocks the Streamlit script (and the GIL keeps a thread
+pool from helping). `build_pdf_cached` first checks a small LRU of
+finished PDFs keyed by a blake2b digest of the inputs, then hands cache
+misses to a module-level ProcessPoolExecutor so independent builds run
+on separate cores. The pool is created lazily and reused across calls
+to amortize worker startup.
+"""
+import hashlib
+import importlib
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+_POOL: ProcessPoolExecutor | None = None
+
+_CACHE: OrderedDict = OrderedDict()
+_CACHE_MAX = 64
+
+
+def _pool() -> ProcessPoolExecutor:
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _POOL
+
+
+def _build_job(form_key, data, i18n, pdf_options, signature_bytes):
+    """Executed in a worker process — must stay module-level (picklable)."""
+    builder = importlib.import_module(f"forms.{form_key}.builder")
+    return builder.build_pdf(
+        data, i18n=i18n, pdf_options=pdf_options, signature_bytes=signature_bytes
+    )
+
+
+def _cache_key(form_key, data, i18n, pdf_options, signature_bytes):
+    h = hashlib.blake2b(digest_size=16)
+    for k in sorted(data):
+        val = data[k]
+        kb = k.encode("utf-8")
+        vb = val if isinstance(val, (bytes, bytearray)) else str(val).encode("utf-8")
+        # length-prefix each piece so adjacent items can't alias (a value
+        # ending in the next key's text must not hash the same)
+        h.update(len(kb).to_bytes(4, "big"))
+        h.update(kb)
+        h.update(len(vb).to_bytes(4, "big"))
+        h.update(vb)
+    h.update(repr(sorted(i18n.items())).encode("utf-8"))
+    h.update(repr(sorted(pdf_options.items())).encode("utf-8"))
+    if signature_bytes:
+        h.update(bytes(signature_bytes))
+    return (form_key, h.digest())
+
+
+def build_pdf_cached(form_key, data, i18n, pdf_options, signature_bytes=None) -> bytes:
+    """Build a form's static PDF, serving repeats from the cache.
+
+    Identical (form_key, data, pdf_options, signature) inputs return the
+    previously rendered bytes without touching ReportLab at all.
+    """
+    key = _cache_key(form_key, data, i18n, pdf_options, signature_bytes)
+    pdf_bytes = _CACHE.get(key)
+    if pdf_bytes is not None:
+        _CACHE.move_to_end(key)
+        return pdf_bytes
+    pdf_bytes = _pool().submit(
+        _build_job, form_key, data, i18n, pdf_options, signature_bytes
+    ).result()
+    _CACHE[key] = pdf_bytes
+    if len(_CACHE) > _CACHE_MAX:
+        _CACHE.popitem(last=False)
+    return pdf_bytes
@@ -1,8 +1,27 @@
 # modules/pdf_utils.py
+from functools import lru_cache
 from reportlab.lib import colors
 from reportlab.platypus import Table, TableStyle
 
+_TRUTHY = frozenset({"1", "true", "ja", "yes", "y", "on", "x", "✓", "checked"})
+
+def _truthy(value) -> bool:
+    """Shared truthiness test for form checkbox values.
+
+    Fast-paths real bools/None/ints so the common case skips the string
+    allocation; everything else falls back to the truthy-marker set.
+    """
+    if value is True:
+        return True
+    if value is False or value is None or value == 0:
+        return False
+    s = value if isinstance(value, str) else str(value)
+    return s.strip().lower() in _TRUTHY
+
+@lru_cache(maxsize=1)
 def base_table_style() -> TableStyle:
+    # Table.setStyle only reads the command list, so one shared instance
+    # is safe across builds
     return TableStyle([
         ("BOX", (0,0), (-1,-1), 1, colors.black),
         ("INNERGRID", (0,0), (-1,-1), 0.5, colors.black),
@@ -13,9 +32,9 @@ def base_table_style() -> TableStyle:
         ("BOTTOMPADDING", (0,0), (-1,-1), 6),
     ])
 
-def checkbox_box(checked: bool, size=12) -> Table:
-    t = Table([["X" if checked else ""]], colWidths=[size], rowHeights=[size])
-    t.setStyle(TableStyle([
+@lru_cache(maxsize=4)
+def _checkbox_box_style(size: int) -> TableStyle:
+    return TableStyle([
         ("BOX", (0,0), (-1,-1), 1, colors.black),
         ("ALIGN", (0,0), (-1,-1), "CENTER"),
         ("VALIGN", (0,0), (-1,-1), "MIDDLE"),
@@ -25,17 +44,23 @@ def checkbox_box(checked: bool, size=12) -> Table:
         ("RIGHTPADDING", (0,0), (-1,-1), 0),
         ("TOPPADDING", (0,0), (-1,-1), 0),
         ("BOTTOMPADDING", (0,0), (-1,-1), 0),
-    ]))
+    ])
+
+_CHECKBOX_ROW_STYLE = TableStyle([
+    ("VALIGN", (0,0), (-1,-1), "MIDDLE"),
+    ("LEFTPADDING", (0,0), (-1,-1), 0),
+    ("RIGHTPADDING", (0,0), (-1,-1), 2),
+    ("TOPPADDING", (0,0), (-1,-1), 0),
+    ("BOTTOMPADDING", (0,0), (-1,-1), 0),
+])
+
+def checkbox_box(checked: bool, size=12) -> Table:
+    t = Table([["X" if checked else ""]], colWidths=[size], rowHeights=[size])
+    t.setStyle(_checkbox_box_style(size))
     return t
 
 def checkbox_row(label: str, checked: bool, *, size=12, label_width=150) -> Table:
     t = Table([[checkbox_box(checked, size=size), label]],
               colWidths=[size+2, label_width], rowHeights=[size])
-    t.setStyle(TableStyle([
-        ("VALIGN", (0,0), (-1,-1), "MIDDLE"),
-        ("LEFTPADDING", (0,0), (-1,-1), 0),
-        ("RIGHTPADDING", (0,0), (-1,-1), 2),
-        ("TOPPADDING", (0,0), (-1,-1), 0),
-        ("BOTTOMPADDING", (0,0), (-1,-1), 0),
-    ]))
+    t.setStyle(_CHECKBOX_ROW_STYLE)
     return t
@@ -100,7 +100,9 @@ def draw_signature_ui(i18n: dict) -> None:
                     rgba = canvas_result.image_data.astype(np.uint8)
                     pil_img = PILImage.fromarray(rgba)
                     out = io.BytesIO()
-                    pil_img.save(out, format="PNG")
+                    # zlib level 1 encodes ~4x faster than the default 6;
+                    # signatures are tiny, so the size difference is noise
+                    pil_img.save(out, format="PNG", compress_level=1, optimize=False)
                     set_signature(out.getvalue())
                     set_signature_meta(source="draw", size_px=pil_img.size)
                     st.success("OK")
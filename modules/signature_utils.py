@@ -1,10 +1,93 @@
+import copy
+from functools import lru_cache
 from io import BytesIO
 from typing import List
-from reportlab.platypus import Image as RLImage, Spacer, Paragraph
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Flowable, Spacer, Paragraph
 from reportlab.lib.styles import getSampleStyleSheet
 from PIL import Image as PILImage
 from modules.image_utils import trim_whitespace
 
+# built once per process; Paragraph parses its source through the
+# paraparser, so the fixed signature line is precomputed. doc.build
+# mutates flowables while wrapping/drawing (blPara, width, canv), so
+# these prototypes are never handed out directly — callers get shallow
+# copies, which share the parsed frags but carry their own layout state
+_STYLES = getSampleStyleSheet()
+_SIG_LINE = Paragraph("_________________________", _STYLES["Normal"])
+
+
+@lru_cache(maxsize=8)
+def _label_paragraph(text: str) -> Paragraph:
+    return Paragraph(text, _STYLES["Normal"])
+
+
+class _PILImageFlowable(Flowable):
+    """Flowable drawing a signature from a prepared ImageReader.
+
+    Platypus' Image flowable only takes a path or file-like object, which
+    forced a PNG re-encode of the trimmed signature just to hand it over.
+    ImageReader accepts the PIL image (or raw stream) directly, so no
+    encode is needed.
+    """
+
+    def __init__(self, reader: ImageReader, width: float, height: float, hAlign: str = "LEFT"):
+        Flowable.__init__(self)
+        self._reader = reader
+        self.width = width
+        self.height = height
+        self.hAlign = hAlign
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        self.canv.drawImage(
+            self._reader, 0, 0,
+            width=self.width, height=self.height, mask="auto"
+        )
+
+
+def _fit_box(w: float, h: float, box_w: float, box_h: float, mode: str = "fit") -> tuple:
+    """Scale (w, h) to fit inside (box_w, box_h) preserving aspect ratio;
+    "stretch" fills the box exactly. Single min() instead of the old
+    compute-then-clamp branches, with a guard for degenerate sizes."""
+    if mode == "stretch":
+        return box_w, box_h
+    scale = min(box_w / max(w, 1), box_h / max(h, 1))
+    return w * scale, h * scale
+
+
+def _reader_for(pil: PILImage.Image) -> ImageReader:
+    """ImageReader for a decoded signature, re-encoded as JPEG when the
+    image is fully opaque — scanned uploads compress an order of
+    magnitude better than the raw bitmap ReportLab would serialize.
+    Anything with real transparency (drawn signatures) keeps the
+    lossless RGBA path so mask=auto still works."""
+    if "A" in pil.getbands() and pil.getchannel("A").getextrema()[0] < 255:
+        return ImageReader(pil if pil.mode == "RGBA" else pil.convert("RGBA"))
+    out = BytesIO()
+    pil.convert("RGB").save(out, format="JPEG", quality=85)
+    return ImageReader(out)
+
+
+@lru_cache(maxsize=8)
+def _decoded_trimmed(signature_bytes: bytes, trim: bool) -> tuple:
+    """Decode the signature once per unique byte content.
+
+    PNG decode + whitespace trim are the dominant cost of the signature
+    path; repeat builds with the same signature hit the cache instead.
+    When trimming changes nothing, the ImageReader wraps the original
+    compressed bytes so ReportLab embeds them without re-encoding the
+    decoded bitmap. Returns (reader, (width, height)).
+    """
+    pil = PILImage.open(BytesIO(signature_bytes))
+    if trim:
+        trimmed = trim_whitespace(pil)
+        if trimmed is not pil:
+            return _reader_for(trimmed), trimmed.size
+    return ImageReader(BytesIO(signature_bytes)), pil.size
+
 
 def build_signature_block(
     signature_bytes: bytes | None,
@@ -23,14 +106,14 @@ def build_signature_block(
     Returns:
         List: List of ReportLab Flowable elements representing the signature block.
     """
-    styles = getSampleStyleSheet()
     block = []
 
     if signature_bytes:
         try:
-            pil = PILImage.open(BytesIO(signature_bytes)).convert("RGBA")
-            if bool(pdf_options.get("signature_trim", True)):
-                pil = trim_whitespace(pil)
+            reader, (w, h) = _decoded_trimmed(
+                bytes(signature_bytes),
+                bool(pdf_options.get("signature_trim", True)),
+            )
 
             box_w = float(
                 pdf_options.get("signature_box_w_pt",
@@ -43,23 +126,10 @@ def build_signature_block(
             mode = pdf_options.get("signature_scale_mode", "fit")
             align = pdf_options.get("signature_align", "LEFT")
 
-            if mode == "stretch":
-                out_w, out_h = box_w, box_h
-            else:
-                w, h = pil.size
-                aspect = (h / w) if w else 1.0
-                out_w = box_w
-                out_h = out_w * aspect
-                if out_h > box_h:
-                    out_h = box_h
-                    out_w = out_h / aspect
-
-            tmp = BytesIO()
-            pil.save(tmp, format="PNG")
-            tmp.seek(0)
-
-            sig_img = RLImage(
-                tmp,
+            out_w, out_h = _fit_box(w, h, box_w, box_h, mode)
+
+            sig_img = _PILImageFlowable(
+                reader,
                 width=out_w,
                 height=out_h,
                 hAlign=align if align in ("LEFT", "CENTER", "RIGHT") else "LEFT"
@@ -68,8 +138,5 @@ def build_signature_block(
         except Exception:
             pass
 
-    block += [
-        Paragraph("_________________________", styles["Normal"]),
-        Paragraph(label_text, styles["Normal"]),
-    ]
+    block += [copy.copy(_SIG_LINE), copy.copy(_label_paragraph(label_text))]
     return block
@@ -2,8 +2,19 @@
 CM_TO_PT = 28.3465
 MM_TO_PT = CM_TO_PT / 10.0
 
-def cm(v: float) -> float:
-    return v * CM_TO_PT
+# factors are bound as defaults so the call body reads a local
+# instead of resolving the module global on every conversion
+def cm(v: float, _k: float = CM_TO_PT) -> float:
+    return v * _k
 
-def mm(v: float) -> float:
-    return v * MM_TO_PT
+def mm(v: float, _k: float = MM_TO_PT) -> float:
+    return v * _k
+
+def cm_arr(a, _k: float = CM_TO_PT):
+    """Vectorized variant: multiplies a whole NumPy array (or any
+    sequence supporting scalar multiply) in one ufunc call instead of
+    one Python call per value."""
+    return a * _k
+
+def mm_arr(a, _k: float = MM_TO_PT):
+    return a * _k